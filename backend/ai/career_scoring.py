@@ -9,6 +9,19 @@ from .evaluation.rag_metrics import RAGMetrics
 from .memory.conversation_memory import ConversationMemory
 
 
+# Score a user needs to meet each required level; shared with CareerService
+LEVEL_SCORES = {
+    "beginner": 25,
+    "intermediate": 50,
+    "advanced": 75,
+    "expert": 100,
+}
+
+
+def level_to_score(level: str) -> int:
+    """Convert a required level (any case) to its numerical score."""
+    return LEVEL_SCORES.get(level.lower(), 25)
+
 
 class CareerScoring:
     """
@@ -16,12 +29,19 @@ class CareerScoring:
     Phase 3A: Enhanced with embeddings, inference, evaluation, and memory.
     """
 
+    # Highest final_score a role can get when the user has none of its
+    # required skills: skill match is 0, the inferred bonus tops out at 50
+    # and trend/growth/learning speed at 1 each (weights as in
+    # calculate_multi_factor_score), plus slack for the rounding
+    MAX_SCORE_WITHOUT_SKILL_OVERLAP = 50 * 0.15 + 1 * 0.15 + 1 * 0.1 + 1 * 0.1 + 0.05
+
     @staticmethod
     def calculate_multi_factor_score(
         db: Session,
         user_id: int,
         role_requirements: List[RoleSkillRequirement],
-        conversation_memory: Optional[ConversationMemory] = None
+        conversation_memory: Optional[ConversationMemory] = None,
+        user_skill_map: Optional[Dict[int, Any]] = None
     ) -> Dict[str, Any]:
         """
         Calculate career match using multiple factors with Phase 3A enhancements:
@@ -30,37 +50,14 @@ class CareerScoring:
         - Skill trend from memory (15%)
         - Growth rate from history (10%)
         - Learning speed estimation (10%)
+
+        Callers scoring many roles for one user can pass a prebuilt
+        skill_id -> skill map to skip reloading the user's skills.
         """
         try:
-            # Get latest skill assessment scores from SkillAssessmentSkill table
-            # This table has correct scores (percentages), unlike UserSkill which has corrupted data
-            from sqlalchemy import func
-            from models.skill_assessment import SkillAssessmentSkill, SkillAssessment
-            
-            # Get the latest assessment for each skill using a proper subquery
-            subquery = db.query(
-                SkillAssessmentSkill.skill_id,
-                func.max(SkillAssessmentSkill.id).label('max_id')
-            ).join(SkillAssessment).filter(
-                SkillAssessment.user_id == user_id
-            ).group_by(SkillAssessmentSkill.skill_id).subquery()
-            
-            latest_assessments = db.query(SkillAssessmentSkill).join(
-                subquery,
-                SkillAssessmentSkill.id == subquery.c.max_id
-            ).all()
-            
-            # Use assessment skills if found, otherwise fallback to UserSkill
-            if latest_assessments:
-                user_skills = latest_assessments
-            else:
-                # Fallback to UserSkill if no assessments found
-                user_skills = db.query(UserSkill).filter(
-                    UserSkill.user_id == user_id
-                ).all()
-            
-            user_skill_map = {us.skill_id: us for us in user_skills}
-
+            if user_skill_map is None:
+                user_skill_map = CareerScoring._load_user_skill_map(db, user_id)
+            user_skills = list(user_skill_map.values())
 
             # Calculate skill match percentage
             skill_match_pct = CareerScoring._calculate_skill_match(
@@ -142,6 +139,38 @@ class CareerScoring:
                 "confidence_level": 0.0
             }
 
+    @staticmethod
+    def _load_user_skill_map(db: Session, user_id: int) -> Dict[int, Any]:
+        """Latest assessed score per skill, falling back to UserSkill."""
+        # Get latest skill assessment scores from SkillAssessmentSkill table
+        # This table has correct scores (percentages), unlike UserSkill which has corrupted data
+        from sqlalchemy import func
+        from models.skill_assessment import SkillAssessmentSkill, SkillAssessment
+
+        # Get the latest assessment for each skill using a proper subquery
+        subquery = db.query(
+            SkillAssessmentSkill.skill_id,
+            func.max(SkillAssessmentSkill.id).label('max_id')
+        ).join(SkillAssessment).filter(
+            SkillAssessment.user_id == user_id
+        ).group_by(SkillAssessmentSkill.skill_id).subquery()
+
+        latest_assessments = db.query(SkillAssessmentSkill).join(
+            subquery,
+            SkillAssessmentSkill.id == subquery.c.max_id
+        ).all()
+
+        # Use assessment skills if found, otherwise fallback to UserSkill
+        if latest_assessments:
+            user_skills = latest_assessments
+        else:
+            # Fallback to UserSkill if no assessments found
+            user_skills = db.query(UserSkill).filter(
+                UserSkill.user_id == user_id
+            ).all()
+
+        return {us.skill_id: us for us in user_skills}
+
     @staticmethod
     def _calculate_skill_match(
         user_skills: Dict[int, UserSkill],
@@ -158,7 +187,7 @@ class CareerScoring:
         for req in requirements:
             user_skill = user_skills.get(req.skill_id)
             current_score = user_skill.score if user_skill else 0
-            required_score = CareerScoring._level_to_score(req.required_level)
+            required_score = level_to_score(req.required_level)
 
             # Base matching
             if current_score >= required_score:
@@ -320,7 +349,7 @@ class CareerScoring:
         for req in requirements:
             user_skill = user_skills.get(req.skill_id)
             current_score = user_skill.score if user_skill else 0
-            required_score = CareerScoring._level_to_score(req.required_level)
+            required_score = level_to_score(req.required_level)
 
             gap = required_score - current_score
             if gap > 0:
@@ -398,16 +427,6 @@ class CareerScoring:
         medium_severity = [s["skill_name"] for s in missing_severity if s["severity"] == "medium"]
         return high_severity + medium_severity
 
-    @staticmethod
-    def _level_to_score(level: str) -> int:
-        """Convert skill level to numerical score."""
-        return {
-            "beginner": 25,
-            "intermediate": 50,
-            "advanced": 75,
-            "expert": 100,
-        }.get(level.lower(), 25)
-
     @staticmethod
     def _evaluate_scoring_quality(
         final_score: float,
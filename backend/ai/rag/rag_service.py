@@ -1,6 +1,6 @@
 from typing import Dict, Any, Optional, List
 from ai.embeddings.embedding_service import EmbeddingService
-from ai.llm.llm_router import LLMRouter
+from ai.llm.llm_router import llm_router
 from ai.config.ai_settings import AISettings
 from ai.rag.prompt_templates import PromptTemplates
 from ai.evaluation.rag_metrics import RAGMetrics
@@ -14,7 +14,8 @@ class RAGService:
     """
 
     def __init__(self):
-        self.llm_router = LLMRouter()
+        # Share the process-wide router rather than building providers per instance
+        self.llm_router = llm_router
 
     @staticmethod
     def answer(
@@ -120,7 +121,7 @@ class RAGService:
 
         # Generate response using LLM router
         try:
-            answer = LLMRouter.llm_router.generate_response(full_prompt)
+            answer = llm_router.generate_response(full_prompt)
 
             # Estimate confidence based on retrieval quality and LLM response
             confidence = RAGService._estimate_answer_confidence(
@@ -130,7 +131,7 @@ class RAGService:
             return {
                 "answer": answer,
                 "confidence": confidence,
-                "model_used": LLMRouter.llm_router.get_current_provider()
+                "model_used": llm_router.get_current_provider()
             }
 
         except Exception as e:
@@ -0,0 +1,61 @@
+"""Add normalized user_note_tags table
+
+Revision ID: 007
+Revises: 006
+Create Date: 2024-02-01 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'user_note_tags',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('note_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('tag', sa.String(length=255), nullable=False),
+        sa.ForeignKeyConstraint(['note_id'], ['user_notes.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_user_note_tag_user_tag', 'user_note_tags', ['user_id', 'tag'])
+    op.create_index('idx_user_note_tag_note_id', 'user_note_tags', ['note_id'])
+
+    # Backfill from the comma-separated user_notes.tags column
+    conn = op.get_bind()
+    notes = conn.execute(
+        sa.text("SELECT id, user_id, tags FROM user_notes WHERE tags IS NOT NULL")
+    ).fetchall()
+
+    rows = []
+    for note_id, user_id, tags in notes:
+        seen = set()
+        for tag in tags.split(","):
+            tag = tag.strip()[:255]
+            if tag and tag not in seen:
+                seen.add(tag)
+                rows.append({"note_id": note_id, "user_id": user_id, "tag": tag})
+
+    if rows:
+        conn.execute(
+            sa.text(
+                "INSERT INTO user_note_tags (note_id, user_id, tag) "
+                "VALUES (:note_id, :user_id, :tag)"
+            ),
+            rows
+        )
+
+
+def downgrade():
+    op.drop_index('idx_user_note_tag_note_id', table_name='user_note_tags')
+    op.drop_index('idx_user_note_tag_user_tag', table_name='user_note_tags')
+    op.drop_table('user_note_tags')
@@ -0,0 +1,33 @@
+"""Add FULLTEXT index for user note search
+
+Revision ID: 008
+Revises: 007
+Create Date: 2024-02-01 00:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # FULLTEXT is MySQL-only; other dialects keep the ilike search path
+    if op.get_bind().dialect.name != 'mysql':
+        return
+    op.create_index(
+        'idx_user_note_fulltext',
+        'user_notes',
+        ['title', 'content', 'tags'],
+        mysql_prefix='FULLTEXT'
+    )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'mysql':
+        return
+    op.drop_index('idx_user_note_fulltext', table_name='user_notes')
@@ -0,0 +1,68 @@
+"""Add recommendation_template and recommended_steps to skills
+
+Revision ID: 009
+Revises: 008
+Create Date: 2024-02-05 00:00:00.000000
+
+"""
+import json
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('skills', sa.Column('recommendation_template', sa.Text(), nullable=True))
+    op.add_column('skills', sa.Column('recommended_steps', sa.Text(), nullable=True))
+
+    # Carry over the rules that used to be hard-coded in get_assessment_results.
+    # Those used a case-sensitive substring check, so the match must be
+    # case-sensitive too (plain LIKE ignores case on MySQL and SQLite).
+    conn = op.get_bind()
+    dialect = conn.dialect.name
+    if dialect == 'mysql':
+        contains = "name LIKE BINARY '%{}%'"
+    elif dialect == 'sqlite':
+        contains = "name GLOB '*{}*'"
+    else:
+        contains = "name LIKE '%{}%'"
+    conn.execute(
+        sa.text(
+            "UPDATE skills SET recommendation_template = :template, recommended_steps = :steps "
+            "WHERE " + contains.format('Database')
+        ),
+        {
+            "template": "Learn SQL joins, indexing, and normalization for {name}",
+            "steps": json.dumps([
+                "Complete SQL basics course",
+                "Practice database design with normalization",
+                "Build projects with complex queries",
+            ]),
+        }
+    )
+    conn.execute(
+        sa.text(
+            "UPDATE skills SET recommendation_template = :template, recommended_steps = :steps "
+            "WHERE " + contains.format('Python') + " AND NOT " + contains.format('Database')
+        ),
+        {
+            "template": "Master Python fundamentals and libraries for {name}",
+            "steps": json.dumps([
+                "Learn Python data structures and algorithms",
+                "Study pandas and numpy libraries",
+                "Build data analysis projects",
+            ]),
+        }
+    )
+
+
+def downgrade():
+    op.drop_column('skills', 'recommended_steps')
+    op.drop_column('skills', 'recommendation_template')
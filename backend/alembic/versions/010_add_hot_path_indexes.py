@@ -0,0 +1,38 @@
+"""Add composite indexes for hot query predicates
+
+Revision ID: 010
+Revises: 009
+Create Date: 2024-02-10 00:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Notes list: WHERE user_id = ? ORDER BY created_at DESC
+    op.create_index('idx_user_note_user_created', 'user_notes', ['user_id', 'created_at'])
+
+    # Latest assessment per user: WHERE user_id = ? ORDER BY created_at DESC
+    op.create_index('idx_assessment_user_created', 'assessments', ['user_id', 'created_at'])
+
+    # Assessment submit/results: WHERE assessment_id = ?
+    op.create_index('idx_assessment_question_assessment_id', 'assessment_questions', ['assessment_id'])
+    op.create_index('idx_assessment_answer_assessment_id', 'assessment_answers', ['assessment_id'])
+
+    # Question bank by skill and difficulty
+    op.create_index('idx_skill_question_skill_difficulty', 'skill_questions', ['skill_id', 'difficulty'])
+
+
+def downgrade():
+    op.drop_index('idx_skill_question_skill_difficulty', table_name='skill_questions')
+    op.drop_index('idx_assessment_answer_assessment_id', table_name='assessment_answers')
+    op.drop_index('idx_assessment_question_assessment_id', table_name='assessment_questions')
+    op.drop_index('idx_assessment_user_created', table_name='assessments')
+    op.drop_index('idx_user_note_user_created', table_name='user_notes')
@@ -0,0 +1,27 @@
+"""Store computed results on assessments
+
+Revision ID: 011
+Revises: 010
+Create Date: 2024-02-12 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Existing rows stay NULL and are scored from their answers on read
+    op.add_column('assessments', sa.Column('result_json', sa.JSON(), nullable=True))
+    op.add_column('assessments', sa.Column('overall_score', sa.Float(), nullable=True))
+
+
+def downgrade():
+    op.drop_column('assessments', 'overall_score')
+    op.drop_column('assessments', 'result_json')
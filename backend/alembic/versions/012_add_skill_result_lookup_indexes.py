@@ -0,0 +1,28 @@
+"""Add composite indexes for the latest per-skill result lookup
+
+Revision ID: 012
+Revises: 011
+Create Date: 2024-02-20 00:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Latest skill assessment per user: WHERE user_id = ? ORDER BY created_at DESC
+    op.create_index('idx_skill_assessment_user_created', 'skill_assessments', ['user_id', 'created_at'])
+
+    # Join side of the same lookup: WHERE skill_id = ? AND assessment_id = ?
+    op.create_index('idx_assessment_skill_skill_assessment', 'skill_assessment_skills', ['skill_id', 'assessment_id'])
+
+
+def downgrade():
+    op.drop_index('idx_assessment_skill_skill_assessment', table_name='skill_assessment_skills')
+    op.drop_index('idx_skill_assessment_user_created', table_name='skill_assessments')
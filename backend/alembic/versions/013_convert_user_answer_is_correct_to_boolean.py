@@ -0,0 +1,43 @@
+"""Store user_answers.is_correct as a boolean
+
+Revision ID: 013
+Revises: 012
+Create Date: 2024-02-22 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '013'
+down_revision = '012'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Copy through a new column; 'true'/'false' strings don't cast in place
+    op.add_column('user_answers', sa.Column('is_correct_bool', sa.Boolean(), nullable=False, server_default=sa.false()))
+    op.execute("UPDATE user_answers SET is_correct_bool = (is_correct = 'true')")
+    op.drop_column('user_answers', 'is_correct')
+    op.alter_column(
+        'user_answers', 'is_correct_bool',
+        new_column_name='is_correct',
+        existing_type=sa.Boolean(),
+        existing_nullable=False,
+        existing_server_default=sa.false(),
+    )
+
+
+def downgrade():
+    op.add_column('user_answers', sa.Column('is_correct_str', sa.String(10), nullable=False, server_default=sa.text("'false'")))
+    op.execute("UPDATE user_answers SET is_correct_str = CASE WHEN is_correct THEN 'true' ELSE 'false' END")
+    op.drop_column('user_answers', 'is_correct')
+    op.alter_column(
+        'user_answers', 'is_correct_str',
+        new_column_name='is_correct',
+        existing_type=sa.String(10),
+        existing_nullable=False,
+        existing_server_default=sa.text("'false'"),
+    )
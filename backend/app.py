@@ -1,7 +1,9 @@
 import sys
 import os
+import orjson
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 
@@ -47,6 +49,27 @@ from routes.resume import router as resume_router
 
 # DATABASE_URL from models.database
 
+# -----------------------------
+# Response serialization
+# -----------------------------
+class AppJSONResponse(ORJSONResponse):
+    """
+    orjson-backed responses. Several routes return dicts keyed by int ids,
+    which json.dumps stringified implicitly; keep that behaviour. The AI
+    scorers return numpy scalars, which jsonable_encoder passes through, so
+    numpy serialization is enabled too.
+
+    NaN and Infinity are written as null (json.dumps wrote the non-standard
+    NaN/Infinity tokens, which JSON.parse rejects).
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(
+            content,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+
+
 # -----------------------------
 # Create FastAPI app
 # -----------------------------
@@ -54,6 +77,7 @@ app = FastAPI(
     title="Career Compass AI",
     description="AI-powered career guidance and skill analysis platform",
     version="1.0.0",
+    default_response_class=AppJSONResponse,
 )
 
 # print(f"DEBUG: DATABASE_URL = {DATABASE_URL}")
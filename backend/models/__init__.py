@@ -23,6 +23,7 @@ from .chat_message import ChatMessage
 from .user import User
 from .user_skill import UserSkill
 from .user_note import UserNote
+from .user_note_tag import UserNoteTag
 from .resume import Resume
 
 __all__ = [
@@ -34,6 +35,7 @@ __all__ = [
     "User",
     "UserSkill",
     "UserNote",
+    "UserNoteTag",
     "Resume",
 
     "Skill",
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, DateTime, Float, ForeignKey, Index, JSON
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from .database import Base
@@ -10,14 +10,23 @@ class Assessment(Base):
     user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    # Scores computed once on submit; NULL for assessments that predate this
+    result_json = Column(JSON, nullable=True)  # skill name -> score breakdown
+    overall_score = Column(Float, nullable=True)
+
     # Relationships
     user = relationship("User", back_populates="assessment_records")
     assessment_questions = relationship("AssessmentQuestion", back_populates="assessment", cascade="all, delete-orphan")
     assessment_answers = relationship("AssessmentAnswer", back_populates="assessment", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        Index("idx_assessment_user_created", "user_id", "created_at"),
+    )
+
     def to_dict(self):
         return {
             "id": self.id,
             "user_id": self.user_id,
             "created_at": self.created_at.isoformat() if self.created_at else None,
+            "overall_score": self.overall_score,
         }
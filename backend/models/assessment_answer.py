@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from .database import Base
 
@@ -13,7 +13,12 @@ class AssessmentAnswer(Base):
 
     # Relationships
     assessment = relationship("Assessment", back_populates="assessment_answers")
-    question = relationship("SkillQuestion", back_populates="assessment_answers")
+    # Load explicitly (selectinload) so per-answer lookups can't slip into N+1
+    question = relationship("SkillQuestion", back_populates="assessment_answers", lazy="raise")
+
+    __table_args__ = (
+        Index("idx_assessment_answer_assessment_id", "assessment_id"),
+    )
 
     def to_dict(self):
         return {
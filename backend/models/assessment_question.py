@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey
+from sqlalchemy import Column, Integer, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from .database import Base
 
@@ -15,6 +15,10 @@ class AssessmentQuestion(Base):
     question = relationship("SkillQuestion", back_populates="assessment_questions")
     skill = relationship("Skill", back_populates="assessment_questions")
 
+    __table_args__ = (
+        Index("idx_assessment_question_assessment_id", "assessment_id"),
+    )
+
     def to_dict(self):
         return {
             "id": self.id,
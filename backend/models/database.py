@@ -1,8 +1,10 @@
 import os
+import time
 import redis
 from typing import Generator
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, declarative_base, Session
 from sqlalchemy.pool import QueuePool
 from dotenv import load_dotenv
@@ -42,19 +44,54 @@ def get_database_url() -> str:
 DATABASE_URL = get_database_url()
 IS_SQLITE = DATABASE_URL.startswith("sqlite")
 
+# Namespace for application cache keys in Redis, so environments or databases
+# sharing one Redis never serve each other's (per-user) entries
+CACHE_KEY_PREFIX = (
+    f'{os.getenv("ENVIRONMENT", "development").lower()}:'
+    f"{make_url(DATABASE_URL).database}"
+)
+
+# Outside production, hot queries add raiseload("*") so an unplanned lazy
+# load (an N+1 in the making) fails loudly instead of silently querying
+STRICT_LOADING = os.getenv("ENVIRONMENT", "development").lower() != "production"
+
 # -------------------------
 # SQLAlchemy Engine
 # -------------------------
+if IS_SQLITE:
+    pool_options = {}
+else:
+    pool_options = {
+        "poolclass": QueuePool,
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "20")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "10")),
+        "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", "30")),
+        # Recycle before MySQL's wait_timeout drops idle connections
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+    }
+
+# Optional server-side cap on SELECT run time (MySQL max_execution_time).
+# Off by default: it also cuts off long admin/report queries, and MariaDB has
+# no such variable
+STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "0"))
+
 engine = create_engine(
     DATABASE_URL,
-    poolclass=QueuePool if not IS_SQLITE else None,
     pool_pre_ping=True,
-    pool_size=10 if not IS_SQLITE else None,
-    max_overflow=20 if not IS_SQLITE else None,
+    # Compiled-SQL cache entries (SQLAlchemy default is 500)
+    query_cache_size=int(os.getenv("DB_QUERY_CACHE_SIZE", "1200")),
     echo=os.getenv("SQLALCHEMY_ECHO", "false").lower() == "true",
     connect_args={"check_same_thread": False} if IS_SQLITE else {},
+    **pool_options,
 )
 
+if DATABASE_URL.startswith("mysql") and STATEMENT_TIMEOUT_MS > 0:
+    @event.listens_for(engine, "connect")
+    def _set_statement_timeout(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f"SET SESSION max_execution_time = {STATEMENT_TIMEOUT_MS}")
+        cursor.close()
+
 # -------------------------
 # Session Factory
 # -------------------------
@@ -70,6 +107,11 @@ SessionLocal = sessionmaker(
 class RedisConnection:
     _instance = None
     _redis_client = None
+    _last_failure = float("-inf")
+
+    # Seconds to wait before retrying after a failed connect, so request
+    # paths don't pay the connect timeout on every call while Redis is down
+    RETRY_INTERVAL = 30
 
     def __new__(cls):
         if cls._instance is None:
@@ -78,21 +120,26 @@ class RedisConnection:
 
     def connect(self):
         if self._redis_client is None:
+            # Each environment points at its own Redis; without REDIS_URL the
+            # caches are simply skipped
+            redis_url = os.getenv("REDIS_URL")
+            if not redis_url:
+                return None
+            if time.monotonic() - self._last_failure < self.RETRY_INTERVAL:
+                return None
             try:
-                client = redis.Redis(
-                    host='redis-19426.c239.us-east-1-2.ec2.cloud.redislabs.com',
-                    port=19426,
+                client = redis.from_url(
+                    redis_url,
                     decode_responses=True,
-                    username="default",
-                    password="8cWErxIfAC2l8PjEAfYLLp339h6Ekv2m",
                     socket_connect_timeout=5
                 )
                 client.ping()
                 self._redis_client = client
-                print("[INFO] Redis Cloud connected successfully")
+                print("[INFO] Redis connected successfully")
             except Exception as e:
                 print(f"[WARN] Redis unavailable: {e}")
                 self._redis_client = None
+                RedisConnection._last_failure = time.monotonic()
         return self._redis_client
 
 
@@ -103,6 +150,11 @@ redis_client = RedisConnection()
 def get_redis():
     return redis_client.connect()
 
+
+def cache_key(key: str) -> str:
+    """Scope a Redis cache key to this environment's database."""
+    return f"{CACHE_KEY_PREFIX}:{key}"
+
 # -------------------------
 # FastAPI DB Dependency
 # -------------------------
@@ -71,6 +71,9 @@ class JobRole(Base):
         Index("idx_job_role_domain", "domain_id"),
     )
 
+    # Fetch server defaults during the flush so to_dict() needs no refresh
+    __mapper_args__ = {"eager_defaults": True}
+
 
     # -------------------------
     # JSON helpers
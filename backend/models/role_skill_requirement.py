@@ -55,6 +55,9 @@ class RoleSkillRequirement(Base):
         ),
     )
 
+    # Fetch server defaults during the flush so to_dict() needs no refresh
+    __mapper_args__ = {"eager_defaults": True}
+
     def to_dict(self) -> dict:
         return {
             "id": self.id,
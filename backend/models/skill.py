@@ -7,6 +7,8 @@ import json
 from .domain import Domain
 
 
+DEFAULT_RECOMMENDATION_TEMPLATE = "Focus on core concepts and practical applications for {name}"
+
 class Skill(Base):
     __tablename__ = 'skills'
 
@@ -33,6 +35,13 @@ class Skill(Base):
         nullable=False
     )
 
+    # Shown when a user scores low on this skill; "{name}" is replaced
+    # with the skill name
+    recommendation_template = Column(Text, nullable=True)
+
+    # JSON array of suggested learning steps for users weak in this skill
+    recommended_steps = Column(Text, nullable=True)
+
     # Relationships
     domain = relationship("Domain", back_populates="skills")
     role_skill_requirements = relationship(
@@ -77,20 +86,41 @@ class Skill(Base):
         cascade="all, delete-orphan",
     )
 
+    # Fetch server defaults during the flush so to_dict() needs no refresh
+    __mapper_args__ = {"eager_defaults": True}
+
 
 
     # -------------------------
     # Helper methods
     # -------------------------
-    def get_depends_on(self):
+    @staticmethod
+    def parse_depends_on(raw):
         try:
-            return json.loads(self.depends_on) if self.depends_on else []
+            return json.loads(raw) if raw else []
         except json.JSONDecodeError:
             return []
 
+    def get_depends_on(self):
+        return Skill.parse_depends_on(self.depends_on)
+
     def set_depends_on(self, depends_on_list):
         self.depends_on = json.dumps(depends_on_list)
 
+    def get_recommendation(self):
+        template = self.recommendation_template or DEFAULT_RECOMMENDATION_TEMPLATE
+        return template.replace("{name}", self.name)
+
+    def get_recommended_steps(self):
+        try:
+            steps = json.loads(self.recommended_steps) if self.recommended_steps else []
+        except json.JSONDecodeError:
+            steps = []
+        return steps or [f"Complete comprehensive {self.name} training"]
+
+    def set_recommended_steps(self, steps_list):
+        self.recommended_steps = json.dumps(steps_list)
+
     # Property to provide compatibility with code expecting 'category'
     @property
     def category(self):
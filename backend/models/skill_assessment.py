@@ -9,7 +9,9 @@ from sqlalchemy import (
     Text,
     Index,
     Float,
+    Boolean,
     text,
+    false,
 )
 from sqlalchemy.orm import relationship
 
@@ -71,6 +73,7 @@ class SkillAssessment(Base):
     __table_args__ = (
         Index("idx_skill_assessment_user_id", "user_id"),
         Index("idx_skill_assessment_created_at", "created_at"),
+        Index("idx_skill_assessment_user_created", "user_id", "created_at"),
         Index("idx_skill_assessment_domain_id", "domain_id"),
     )
 
@@ -175,6 +178,7 @@ class SkillAssessmentSkill(Base):
     __table_args__ = (
         Index("idx_assessment_skill_assessment_id", "assessment_id"),
         Index("idx_assessment_skill_skill_id", "skill_id"),
+        Index("idx_assessment_skill_skill_assessment", "skill_id", "assessment_id"),
     )
 
 
@@ -205,7 +209,7 @@ class UserAnswer(Base):
     )
 
     user_answer = Column(String(500), nullable=False)
-    is_correct = Column(String(10), nullable=False, server_default=text("'false'"))
+    is_correct = Column(Boolean, nullable=False, server_default=false())
 
     created_at = Column(DateTime, nullable=False, server_default=text("CURRENT_TIMESTAMP"))
 
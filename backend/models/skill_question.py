@@ -1,5 +1,5 @@
 from .database import Base
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, text, Index
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, text, Index, func
 from sqlalchemy.orm import relationship
 import json
 
@@ -62,6 +62,7 @@ class SkillQuestion(Base):
     __table_args__ = (
         Index('idx_skill_question_skill_id', 'skill_id'),
         Index('idx_skill_question_difficulty', 'difficulty'),
+        Index('idx_skill_question_skill_difficulty', 'skill_id', 'difficulty'),
     )
 
     # -----------------
@@ -93,6 +94,13 @@ class SkillQuestion(Base):
 
     @classmethod
     def find_random_by_skill(cls, db, skill_id, limit=10):
-        # For now, just get all and limit; in production, randomize
-        questions = db.query(cls).filter(cls.skill_id == skill_id).limit(limit).all()
+        # Let the database pick the sample so only `limit` rows are shipped
+        random_order = func.rand() if db.get_bind().dialect.name == "mysql" else func.random()
+        questions = (
+            db.query(cls)
+            .filter(cls.skill_id == skill_id)
+            .order_by(random_order)
+            .limit(limit)
+            .all()
+        )
         return questions
@@ -1,7 +1,20 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
+import re
+
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index, or_
+from sqlalchemy.dialects.mysql import match
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from .database import Base
+from .user_note_tag import UserNoteTag
+
+# InnoDB defaults: innodb_ft_min_token_size and the built-in stopword list
+FULLTEXT_MIN_TOKEN_SIZE = 3
+FULLTEXT_STOPWORDS = frozenset({
+    "a", "about", "an", "are", "as", "at", "be", "by", "com", "de", "en",
+    "for", "from", "how", "i", "in", "is", "it", "la", "of", "on", "or",
+    "that", "the", "this", "to", "was", "what", "when", "where", "who",
+    "will", "with", "und", "www",
+})
 
 
 class UserNote(Base):
@@ -46,13 +59,26 @@ class UserNote(Base):
     user = relationship("User", back_populates="notes")
     learning_resource = relationship("LearningResource")
     learning_path_step = relationship("LearningPathStep")
+    tag_rows = relationship("UserNoteTag", back_populates="note", cascade="all, delete-orphan")
     
     __table_args__ = (
         Index("idx_user_note_user_id", "user_id"),
         Index("idx_user_note_created_at", "created_at"),
         Index("idx_user_note_resource_id", "learning_resource_id"),
+        Index("idx_user_note_user_created", "user_id", "created_at"),
+        # Backs full-text search on MySQL (migration 008); other dialects
+        # search with ilike and don't get the index
+        Index(
+            "idx_user_note_fulltext", "title", "content", "tags",
+            mysql_prefix="FULLTEXT"
+        ).ddl_if(dialect="mysql"),
     )
     
+    # Fetch server-generated timestamps as part of the flush (INSERT/UPDATE
+    # ... RETURNING where the dialect supports it) so notes can be serialized
+    # without a refresh round-trip after commit
+    __mapper_args__ = {"eager_defaults": True}
+    
     def to_dict(self) -> dict:
         return {
             "id": self.id,
@@ -72,7 +98,7 @@ class UserNote(Base):
     def create(cls, db, user_id, title, content, code_snippet=None, 
                code_language=None, learning_resource_id=None, 
                learning_path_step_id=None, tags=None):
-        """Create a new user note."""
+        """Create a new user note. The caller commits."""
         note = cls(
             user_id=user_id,
             title=title,
@@ -84,8 +110,8 @@ class UserNote(Base):
             tags=tags
         )
         db.add(note)
-        db.commit()
-        db.refresh(note)
+        db.flush()
+        UserNoteTag.replace_for_note(db, note)
         return note
     
     @classmethod
@@ -109,9 +135,40 @@ class UserNote(Base):
     @classmethod
     def search_by_tags(cls, db, user_id, tags):
         """Search notes by tags."""
-        from sqlalchemy import or_
-        tag_filters = [cls.tags.ilike(f"%{tag}%") for tag in tags]
+        matching_ids = db.query(UserNoteTag.note_id).filter(
+            UserNoteTag.user_id == user_id,
+            UserNoteTag.tag.in_([tag.strip() for tag in tags])
+        )
+        return db.query(cls).filter(
+            cls.user_id == user_id,
+            cls.id.in_(matching_ids)
+        ).order_by(cls.created_at.desc()).all()
+    
+    @classmethod
+    def search(cls, db, user_id, query):
+        """Search notes by title, content, or tags."""
+        terms = re.findall(r"\w+", query)
+        # FULLTEXT never matches short words or stopwords, so those
+        # searches keep the ilike path
+        use_fulltext = bool(terms) and all(
+            len(term) >= FULLTEXT_MIN_TOKEN_SIZE
+            and term.lower() not in FULLTEXT_STOPWORDS
+            for term in terms
+        )
+        if use_fulltext and db.get_bind().dialect.name == "mysql":
+            # Boolean mode: every word must appear, as a word prefix
+            search_filter = match(
+                cls.title, cls.content, cls.tags,
+                against=" ".join(f"+{term}*" for term in terms)
+            ).in_boolean_mode()
+        else:
+            search_filter = or_(
+                cls.title.ilike(f"%{query}%"),
+                cls.content.ilike(f"%{query}%"),
+                cls.tags.ilike(f"%{query}%")
+            )
+        
         return db.query(cls).filter(
             cls.user_id == user_id,
-            or_(*tag_filters)
+            search_filter
         ).order_by(cls.created_at.desc()).all()
@@ -0,0 +1,60 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
+from sqlalchemy.orm import relationship
+from .database import Base
+
+
+class UserNoteTag(Base):
+    """
+    Normalized tags for user notes.
+    One row per (note, tag) so tag filters and tag listings are index lookups
+    instead of substring scans over the comma-separated UserNote.tags column.
+    """
+    __tablename__ = "user_note_tags"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    note_id = Column(
+        Integer,
+        ForeignKey("user_notes.id", ondelete="CASCADE"),
+        nullable=False
+    )
+
+    # Denormalized from the note so per-user tag lookups don't need a join
+    user_id = Column(
+        Integer,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False
+    )
+
+    tag = Column(String(255), nullable=False)
+
+    # Relationships
+    note = relationship("UserNote", back_populates="tag_rows")
+
+    __table_args__ = (
+        Index("idx_user_note_tag_user_tag", "user_id", "tag"),
+        Index("idx_user_note_tag_note_id", "note_id"),
+    )
+
+    @staticmethod
+    def parse(tags):
+        """Split a comma-separated tags string into unique, trimmed tags."""
+        if not tags:
+            return []
+        seen = []
+        for tag in tags.split(","):
+            tag = tag.strip()[:255]
+            if tag and tag not in seen:
+                seen.append(tag)
+        return seen
+
+    @classmethod
+    def replace_for_note(cls, db, note):
+        """Rewrite the tag rows of a (flushed) note from its tags string."""
+        db.query(cls).filter(cls.note_id == note.id).delete(synchronize_session=False)
+        mappings = [
+            {"note_id": note.id, "user_id": note.user_id, "tag": tag}
+            for tag in cls.parse(note.tags)
+        ]
+        if mappings:
+            db.bulk_insert_mappings(cls, mappings)
@@ -1,4 +1,7 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Index, text
+from datetime import datetime
+
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Index, exists, func, select, text
+from sqlalchemy.dialects.mysql import insert as mysql_insert
 from sqlalchemy.orm import relationship
 from .database import Base
 
@@ -82,6 +85,68 @@ class UserSkill(Base):
         db.refresh(user_skill)
         return user_skill
 
+    @classmethod
+    def upsert_quiz_result(cls, db, user_id, skill_id, level, percentage):
+        """
+        Record a quiz score against the user's skill. An existing row blends
+        confidence as old * 0.4 + score * 0.6 (clamped to 0-100); a new row
+        starts at the score. Returns True when an existing row was updated.
+        On MySQL the write is a single INSERT ... ON DUPLICATE KEY UPDATE
+        against the (user_id, skill_id) unique index, preceded by an indexed
+        existence probe for the return value.
+        """
+        assessed_at = datetime.utcnow()
+
+        if db.get_bind().dialect.name == "mysql":
+            # The upsert's affected-row count can't tell an update from an
+            # insert: with CLIENT_FOUND_ROWS (set by mysqlconnector) a
+            # same-second resubmit that leaves every value unchanged reports 1,
+            # just like an insert
+            existed = db.execute(
+                select(exists().where(
+                    cls.user_id == user_id, cls.skill_id == skill_id
+                ))
+            ).scalar()
+            stmt = mysql_insert(cls).values(
+                user_id=user_id,
+                skill_id=skill_id,
+                level=level,
+                confidence=int(percentage),
+                score=percentage,
+                assessed_at=assessed_at,
+            )
+            blended = func.floor(cls.confidence * 0.4 + percentage * 0.6)
+            stmt = stmt.on_duplicate_key_update(
+                confidence=func.greatest(0, func.least(100, blended)),
+                score=stmt.inserted.score,
+                level=stmt.inserted.level,
+                assessed_at=stmt.inserted.assessed_at,
+                updated_at=func.now(),
+            )
+            db.execute(stmt)
+            return bool(existed)
+
+        user_skill = db.query(cls).filter(
+            cls.user_id == user_id, cls.skill_id == skill_id
+        ).first()
+        if user_skill:
+            new_confidence = int((user_skill.confidence * 0.4) + (percentage * 0.6))
+            user_skill.confidence = max(0, min(100, new_confidence))
+            user_skill.score = percentage
+            user_skill.level = level
+            user_skill.assessed_at = assessed_at
+        else:
+            db.add(cls(
+                user_id=user_id,
+                skill_id=skill_id,
+                level=level,
+                confidence=int(percentage),
+                score=percentage,
+                assessed_at=assessed_at,
+            ))
+        db.flush()
+        return user_skill is not None
+
     @classmethod
     def find_by_user(cls, db, user_id):
         return db.query(cls).filter(cls.user_id == user_id).all()
@@ -94,7 +94,7 @@ def create_user(
         
         # Update additional fields if provided
         if user_data.get("currentRole"):
-            new_user.currentRole = user_data.get("currentRole")
+            new_user.current_role = user_data.get("currentRole")
             db.commit()
         
         return {
@@ -104,7 +104,7 @@ def create_user(
                 "email": new_user.email,
                 "name": new_user.name,
                 "role": new_user.role,
-                "currentRole": new_user.currentRole
+                "currentRole": new_user.current_role
             }
         }
     except HTTPException:
@@ -136,7 +136,7 @@ def update_user(
             user.role = user_data["role"]
         
         if "currentRole" in user_data:
-            user.currentRole = user_data["currentRole"]
+            user.current_role = user_data["currentRole"]
         
         # Update password if provided
         if "password" in user_data and user_data["password"]:
@@ -145,6 +145,7 @@ def update_user(
         
         db.commit()
         db.refresh(user)
+        AdminService.invalidate_cached_role(user_id)
         
         return {
             "message": "User updated successfully",
@@ -153,7 +154,7 @@ def update_user(
                 "email": user.email,
                 "name": user.name,
                 "role": user.role,
-                "currentRole": user.currentRole
+                "currentRole": user.current_role
             }
         }
     except HTTPException:
@@ -182,6 +183,7 @@ def delete_user(
         
         db.delete(user)
         db.commit()
+        AdminService.invalidate_cached_role(user_id)
         
         return {"message": "User deleted successfully"}
     except HTTPException:
@@ -11,6 +11,8 @@ from models.user import User
 from models.domain import Domain
 from models.skill import Skill
 from routes.auth_fastapi import get_current_user
+from services.career_service import CareerService
+from services.skills_service import SkillsService
 
 router = APIRouter(prefix="/admin", tags=["Admin Domain & Skills Management"])
 
@@ -156,6 +158,8 @@ def update_domain(
         
         db.commit()
         db.refresh(domain)
+        SkillsService.invalidate_skill_catalog()
+        CareerService.invalidate_role_catalog()
         
         return {
             "message": "Domain updated successfully",
@@ -188,6 +192,8 @@ def delete_domain(
         # Delete domain (cascade will delete associated skills)
         db.delete(domain)
         db.commit()
+        SkillsService.invalidate_skill_catalog()
+        CareerService.invalidate_role_catalog()
         
         return {
             "message": f"Domain deleted successfully. {skills_count} associated skills were also removed.",
@@ -313,9 +319,16 @@ def create_skill(
         if "depends_on" in skill_data:
             new_skill.set_depends_on(skill_data["depends_on"])
         
+        # Set weak-skill recommendation content if provided
+        if "recommendation_template" in skill_data:
+            new_skill.recommendation_template = skill_data["recommendation_template"]
+        if "recommended_steps" in skill_data:
+            new_skill.set_recommended_steps(skill_data["recommended_steps"])
+        
         db.add(new_skill)
         db.commit()
         db.refresh(new_skill)
+        SkillsService.invalidate_skill_catalog()
         
         return {
             "message": "Skill created successfully",
@@ -397,8 +410,16 @@ def update_skill(
         if "depends_on" in skill_data:
             skill.set_depends_on(skill_data["depends_on"])
         
+        # Update weak-skill recommendation content if provided
+        if "recommendation_template" in skill_data:
+            skill.recommendation_template = skill_data["recommendation_template"]
+        if "recommended_steps" in skill_data:
+            skill.set_recommended_steps(skill_data["recommended_steps"])
+        
         db.commit()
         db.refresh(skill)
+        SkillsService.invalidate_skill_catalog()
+        CareerService.invalidate_role_catalog()
         
         return {
             "message": "Skill updated successfully",
@@ -435,6 +456,8 @@ def delete_skill(
         skill_name = skill.name
         db.delete(skill)
         db.commit()
+        SkillsService.invalidate_skill_catalog()
+        CareerService.invalidate_role_catalog()
         
         return {
             "message": f"Skill '{skill_name}' deleted successfully",
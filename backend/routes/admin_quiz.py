@@ -281,7 +281,7 @@ def bulk_delete_questions(
 
 
 @router.post("/upload-excel")
-async def upload_excel(
+def upload_excel(
     file: UploadFile = File(...),
     skill_id: Optional[int] = None,
     db: Session = Depends(get_db),
@@ -300,7 +300,7 @@ async def upload_excel(
             )
         
         # Read file content
-        contents = await file.read()
+        contents = file.file.read()
         
         # Parse Excel/CSV
         if file.filename.endswith('.csv'):
@@ -1,11 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, func
 from typing import Optional
 
 
 from models.database import get_db
 from models.user import User
+from models.skill import Skill
+from models.skill_assessment import SkillAssessmentSkill, SkillAssessment
+from models.user_skill import UserSkill
 from routes.auth_fastapi import get_current_user
 from schemas.assessment import (
     InitializeAssessmentRequest,
@@ -23,7 +26,7 @@ router = APIRouter(prefix="/api/assessment", tags=["Assessment"])
 
 
 @router.post("/initialize", response_model=SelectedSkillsResponse)
-async def initialize_assessment(
+def initialize_assessment(
     request: InitializeAssessmentRequest,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -46,7 +49,7 @@ async def initialize_assessment(
 
 
 @router.get("/selected-skills", response_model=SelectedSkillsResponse)
-async def get_selected_skills(
+def get_selected_skills(
     assessment_id: Optional[int] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -69,7 +72,7 @@ async def get_selected_skills(
 
 
 @router.get("/start/{skill_id}", response_model=StartQuizResponse)
-async def start_skill_quiz(
+def start_skill_quiz(
     skill_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -93,7 +96,7 @@ async def start_skill_quiz(
 
 
 @router.post("/submit", response_model=SubmitQuizResponse)
-async def submit_quiz(
+def submit_quiz(
     request: SubmitQuizRequest,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -116,7 +119,7 @@ async def submit_quiz(
 
 
 @router.get("/result/{skill_id}", response_model=AssessmentResultResponse)
-async def get_assessment_result(
+def get_assessment_result(
     skill_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -139,7 +142,7 @@ async def get_assessment_result(
 
 
 @router.delete("/delete/{skill_id}")
-async def delete_assessment(
+def delete_assessment(
     skill_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -148,9 +151,6 @@ async def delete_assessment(
     Delete a skill assessment for the current user
     """
     try:
-        from models.skill_assessment import SkillAssessmentSkill, SkillAssessment
-        from models.user_skill import UserSkill
-        
         # Delete from SkillAssessmentSkill (assessment records)
         assessment_skills = db.query(SkillAssessmentSkill).join(
             SkillAssessment
@@ -188,7 +188,7 @@ async def delete_assessment(
 
 
 @router.get("/completed")
-async def get_completed_assessments(
+def get_completed_assessments(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -196,10 +196,6 @@ async def get_completed_assessments(
     Get all completed assessments for the current user
     """
     try:
-        from models.skill import Skill
-        from models.skill_assessment import SkillAssessmentSkill, SkillAssessment
-        from sqlalchemy import desc, func
-        
         # DEBUG: Log what we're fetching
         print(f"DEBUG: Fetching completed assessments for user {current_user.id}")
         
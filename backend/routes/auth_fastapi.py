@@ -82,7 +82,7 @@ def get_current_user(
     except Exception:
         raise HTTPException(status_code=401, detail="Invalid token")
 
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
@@ -157,11 +157,7 @@ def refresh_token(
     db: Session = Depends(get_db),
 ):
     try:
-        payload = jwt.decode(
-            request.refresh_token,
-            JWT_SECRET,
-            algorithms=[JWT_ALGORITHM],
-        )
+        payload = AuthService.decode_refresh_token(request.refresh_token)
         user_id = int(payload.get("sub"))
 
         return AuthService.refresh_access_token(
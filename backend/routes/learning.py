@@ -1,3 +1,5 @@
+import logging
+
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
@@ -7,6 +9,8 @@ from models.user import User
 from services.learning_service import LearningService
 from routes.auth_fastapi import get_current_user
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/learning", tags=["Learning"])
 
 
@@ -45,22 +49,19 @@ def generate_learning_path(
     Generate a new learning path for a target role
     """
     try:
-        print(f"Generating learning path for user {current_user.id}, role {request.roleId}")
+        logger.debug("generating learning path user=%s role=%s", current_user.id, request.roleId)
         result = LearningService.generate_learning_path(
             db=db,
             user_id=current_user.id,
             target_role_id=request.roleId,
         )
-        print(f"Successfully generated learning path: {result.get('id')}")
+        logger.debug("generated learning path id=%s", result.get("id"))
         return result
     except ValueError as e:
-        print(f"ValueError in generate_learning_path: {str(e)}")
+        logger.info("learning path not generated user=%s role=%s: %s", current_user.id, request.roleId, e)
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
-        import traceback
-        error_msg = f"Error generating learning path: {str(e)}"
-        print(error_msg)
-        print(traceback.format_exc())
+        logger.exception("error generating learning path user=%s role=%s", current_user.id, request.roleId)
         raise HTTPException(status_code=500, detail=f"Failed to generate learning path: {str(e)}")
 
 
@@ -19,7 +19,7 @@ router = APIRouter(prefix="/api/resumes", tags=["Resumes"])
 # ============== Resume CRUD Operations ==============
 
 @router.get("", response_model=Dict[str, Any])
-async def get_user_resumes(
+def get_user_resumes(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -41,7 +41,7 @@ async def get_user_resumes(
 
 
 @router.post("", response_model=Dict[str, Any])
-async def create_resume(
+def create_resume(
     title: str = Form(...),
     personal_info: str = Form(...),
     summary: Optional[str] = Form(None),
@@ -97,7 +97,7 @@ async def create_resume(
 
 
 @router.get("/{resume_id}", response_model=Dict[str, Any])
-async def get_resume(
+def get_resume(
     resume_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -128,7 +128,7 @@ async def get_resume(
 
 
 @router.put("/{resume_id}", response_model=Dict[str, Any])
-async def update_resume(
+def update_resume(
     resume_id: int,
     title: Optional[str] = Form(None),
     personal_info: Optional[str] = Form(None),
@@ -199,7 +199,7 @@ async def update_resume(
 
 
 @router.delete("/{resume_id}", response_model=Dict[str, Any])
-async def delete_resume(
+def delete_resume(
     resume_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -233,7 +233,7 @@ async def delete_resume(
 # ============== File Upload & ATS Analysis ==============
 
 @router.post("/upload", response_model=Dict[str, Any])
-async def upload_resume(
+def upload_resume(
     file: UploadFile = File(...),
     title: Optional[str] = Form(None),
     db: Session = Depends(get_db),
@@ -252,7 +252,7 @@ async def upload_resume(
             )
         
         # Read file content
-        content = await file.read()
+        content = file.file.read()
         
         # Check file size (max 5MB)
         if len(content) > 5 * 1024 * 1024:
@@ -273,7 +273,10 @@ async def upload_resume(
         # Extract structured data
         extracted_data = ResumeService.extract_resume_data(parse_result["text"])
         
-        # Create resume with parsed content
+        # Perform ATS analysis
+        ats_analysis = ResumeService.analyze_ats_score(parse_result["text"])
+        
+        # Create resume with parsed content, file info and ATS score in one INSERT
         resume_title = title or f"Uploaded Resume - {file.filename}"
         
         resume = ResumeService.create_resume(
@@ -286,22 +289,12 @@ async def upload_resume(
             education=extracted_data.get("education", []),
             skills=extracted_data.get("skills", []),
             certifications=[],
-            projects=[]
+            projects=[],
+            parsed_content=parse_result["text"],
+            original_filename=file.filename,
+            ats_analysis=ats_analysis
         )
         
-        # Store parsed content and file info
-        resume.parsed_content = parse_result["text"]
-        resume.original_filename = file.filename
-        db.commit()
-        
-        # Perform ATS analysis
-        ats_analysis = ResumeService.analyze_ats_score(parse_result["text"])
-        
-        # Update resume with ATS score
-        resume.ats_score = ats_analysis["overall_score"]
-        resume.ats_analysis = ats_analysis
-        db.commit()
-        
         return {
             "success": True,
             "message": "Resume uploaded and analyzed successfully",
@@ -320,7 +313,7 @@ async def upload_resume(
 
 
 @router.post("/{resume_id}/ats-score", response_model=Dict[str, Any])
-async def analyze_ats_score(
+def analyze_ats_score(
     resume_id: int,
     job_description: Optional[str] = Form(None),
     db: Session = Depends(get_db),
@@ -331,36 +324,19 @@ async def analyze_ats_score(
     Optionally provide a job description for targeted analysis
     """
     try:
-        resume = Resume.find_by_id(db, resume_id, current_user.id)
+        text_to_analyze = ResumeService.get_ats_source_text(db, resume_id, current_user.id)
         
-        if not resume:
+        if text_to_analyze is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Resume not found"
             )
         
-        # Get text to analyze
-        text_to_analyze = resume.parsed_content or ""
-        
-        # If no parsed content, try to build from structured data
-        if not text_to_analyze:
-            text_parts = []
-            if resume.summary:
-                text_parts.append(resume.summary)
-            if resume.skills:
-                text_parts.append(" ".join(resume.skills))
-            if resume.experience:
-                for exp in resume.experience:
-                    text_parts.append(exp.get("description", ""))
-            text_to_analyze = " ".join(text_parts)
-        
         # Perform ATS analysis
         ats_analysis = ResumeService.analyze_ats_score(text_to_analyze, job_description)
         
         # Update resume with new analysis
-        resume.ats_score = ats_analysis["overall_score"]
-        resume.ats_analysis = ats_analysis
-        db.commit()
+        ResumeService.save_ats_analysis(db, resume_id, current_user.id, ats_analysis)
         
         return {
             "success": True,
@@ -378,7 +354,7 @@ async def analyze_ats_score(
 
 
 @router.get("/{resume_id}/ats-analysis", response_model=Dict[str, Any])
-async def get_ats_analysis(
+def get_ats_analysis(
     resume_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -1,5 +1,9 @@
+import random
+import traceback
+from collections import defaultdict
+
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
 
@@ -11,11 +15,15 @@ from models.assessment import Assessment
 from models.assessment_question import AssessmentQuestion
 from models.assessment_answer import AssessmentAnswer
 from models.skill_question import SkillQuestion
-from services.skills_service import SkillsService
+from models.skill_assessment import SkillAssessment
+from services.skills_service import SkillsService, classify_percentage
 from routes.auth_fastapi import get_current_user
 
 router = APIRouter(tags=["Skills"])
 
+# Questions drawn per skill for an assessment, by difficulty
+QUESTION_DISTRIBUTION = (("easy", 3), ("medium", 4), ("hard", 3))
+
 
 # ----------------------------
 # Pydantic Schemas
@@ -99,7 +107,6 @@ def analyze_skills(
             "recommendations": result.get("recommendations", [])
         }
     except Exception as e:
-        import traceback
         print(f"Error in analyze_skills route: {e}")
         print(traceback.format_exc())
         # Return fallback response instead of error
@@ -116,8 +123,7 @@ def get_skills_by_domain(domain_id: int, db: Session = Depends(get_db)):
     Get all skills for a specific domain
     """
     try:
-        skills = db.query(Skill).filter_by(domain_id=domain_id).all()
-        return [skill.to_dict() for skill in skills]
+        return SkillsService.get_skill_catalog(db, domain_id=domain_id)
     except Exception:
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -133,22 +139,31 @@ def start_assessment(request: AssessmentStartRequest, db: Session = Depends(get_
         db.flush()  # Get the assessment ID
 
         questions_data = {}
+        assessment_question_mappings = []
+
+        # Fetch all requested skills and their question banks up front,
+        # then bucket questions by (skill_id, difficulty)
+        skills_by_id = {
+            s.id: s
+            for s in db.query(Skill).filter(Skill.id.in_(request.skill_ids)).all()
+        }
+        buckets = defaultdict(lambda: defaultdict(list))
+        for q in db.query(SkillQuestion).filter(SkillQuestion.skill_id.in_(request.skill_ids)).all():
+            buckets[q.skill_id][q.difficulty].append(q)
 
         for skill_id in request.skill_ids:
             # Get skill info
-            skill = db.query(Skill).filter_by(id=skill_id).first()
+            skill = skills_by_id.get(skill_id)
             if not skill:
                 raise HTTPException(status_code=404, detail=f"Skill {skill_id} not found")
 
-            # Get questions for this skill with difficulty distribution
-            easy_questions = db.query(SkillQuestion).filter_by(skill_id=skill_id, difficulty="easy").limit(3).all()
-            medium_questions = db.query(SkillQuestion).filter_by(skill_id=skill_id, difficulty="medium").limit(4).all()
-            hard_questions = db.query(SkillQuestion).filter_by(skill_id=skill_id, difficulty="hard").limit(3).all()
-
-            skill_questions = easy_questions + medium_questions + hard_questions
+            # Pick questions for this skill with difficulty distribution
+            skill_questions = []
+            for difficulty, count in QUESTION_DISTRIBUTION:
+                bank = buckets[skill_id][difficulty]
+                skill_questions.extend(random.sample(bank, min(count, len(bank))))
 
             # Shuffle questions
-            import random
             random.shuffle(skill_questions)
 
             questions_data[str(skill_id)] = {
@@ -164,14 +179,17 @@ def start_assessment(request: AssessmentStartRequest, db: Session = Depends(get_
             }
 
             # Link questions to assessment
-            for question in skill_questions:
-                assessment_question = AssessmentQuestion(
-                    assessment_id=assessment.id,
-                    question_id=question.id,
-                    skill_id=skill_id
-                )
-                db.add(assessment_question)
-
+            assessment_question_mappings.extend(
+                {
+                    "assessment_id": assessment.id,
+                    "question_id": question.id,
+                    "skill_id": skill_id,
+                }
+                for question in skill_questions
+            )
+
+        if assessment_question_mappings:
+            db.bulk_insert_mappings(AssessmentQuestion, assessment_question_mappings)
         db.commit()
 
         return {
@@ -187,8 +205,8 @@ def start_assessment(request: AssessmentStartRequest, db: Session = Depends(get_
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
-@router.post("/assessment/submit")
-def submit_assessment(request: AssessmentSubmitRequest, db: Session = Depends(get_db)):
+@router.post("/assessment/submit", operation_id="submit_assessment_answers")
+def submit_assessment_answers(request: AssessmentSubmitRequest, db: Session = Depends(get_db)):
     """
     Submit assessment answers and calculate results
     """
@@ -211,6 +229,19 @@ def submit_assessment(request: AssessmentSubmitRequest, db: Session = Depends(ge
                 skill_question_map[aq.skill_id] = []
             skill_question_map[aq.skill_id].append(aq.question_id)
 
+        # Fetch all referenced questions and skills up front
+        all_question_ids = {aq.question_id for aq in assessment_questions}
+        questions_by_id = {
+            q.id: q
+            for q in db.query(SkillQuestion).filter(SkillQuestion.id.in_(all_question_ids)).all()
+        } if all_question_ids else {}
+        skills_by_id = {
+            s.id: s
+            for s in db.query(Skill).filter(Skill.id.in_(skill_question_map.keys())).all()
+        } if skill_question_map else {}
+
+        answer_mappings = []
+
         # Process answers for each skill
         for skill_id, question_ids in skill_question_map.items():
             skill_correct = 0
@@ -221,18 +252,17 @@ def submit_assessment(request: AssessmentSubmitRequest, db: Session = Depends(ge
                     user_answer = request.answers[question_id]
 
                     # Get correct answer
-                    question = db.query(SkillQuestion).filter_by(id=question_id).first()
+                    question = questions_by_id.get(question_id)
                     if question:
                         is_correct = user_answer == question.correct_answer
 
                         # Save answer
-                        answer_record = AssessmentAnswer(
-                            assessment_id=request.assessment_id,
-                            question_id=question_id,
-                            user_answer=user_answer,
-                            is_correct=is_correct
-                        )
-                        db.add(answer_record)
+                        answer_mappings.append({
+                            "assessment_id": request.assessment_id,
+                            "question_id": question_id,
+                            "user_answer": user_answer,
+                            "is_correct": is_correct,
+                        })
 
                         if is_correct:
                             skill_correct += 1
@@ -242,18 +272,10 @@ def submit_assessment(request: AssessmentSubmitRequest, db: Session = Depends(ge
             percentage = (skill_correct / skill_total) * 100 if skill_total > 0 else 0
 
             # Determine level and gap
-            if percentage <= 40:
-                level = "Beginner"
-                gap = "High"
-            elif percentage <= 70:
-                level = "Intermediate"
-                gap = "Medium"
-            else:
-                level = "Advanced"
-                gap = "Low"
+            level, gap = classify_percentage(percentage)
 
             # Get skill name
-            skill = db.query(Skill).filter_by(id=skill_id).first()
+            skill = skills_by_id.get(skill_id)
             skill_name = skill.name if skill else f"Skill {skill_id}"
 
             skill_scores[skill_name] = {
@@ -267,6 +289,12 @@ def submit_assessment(request: AssessmentSubmitRequest, db: Session = Depends(ge
 
         overall_score = (total_correct / total_questions) * 100 if total_questions > 0 else 0
 
+        if answer_mappings:
+            db.bulk_insert_mappings(AssessmentAnswer, answer_mappings)
+
+        # Answers are immutable once submitted, so store the scores for reads
+        assessment.result_json = skill_scores
+        assessment.overall_score = overall_score
         db.commit()
 
         return {
@@ -299,56 +327,60 @@ def get_assessment_results(user_id: int, db: Session = Depends(get_db)):
         if not assessment:
             raise HTTPException(status_code=404, detail="No assessment found for this user")
 
-        # Get assessment answers
-        answers = db.query(AssessmentAnswer).filter_by(assessment_id=assessment.id).all()
-
-        # Calculate skill-wise scores
-        skill_scores = {}
-        total_correct = 0
-        total_questions = len(answers)
-
-        # Group answers by skill
-        skill_answers = {}
-        for answer in answers:
-            question = db.query(SkillQuestion).filter_by(id=answer.question_id).first()
-            if question:
-                skill_id = question.skill_id
-                if skill_id not in skill_answers:
-                    skill_answers[skill_id] = []
-                skill_answers[skill_id].append(answer)
-
-        for skill_id, skill_answer_list in skill_answers.items():
-            skill_correct = sum(1 for a in skill_answer_list if a.is_correct)
-            skill_total = len(skill_answer_list)
-            percentage = (skill_correct / skill_total) * 100 if skill_total > 0 else 0
-
-            # Determine level and gap
-            if percentage <= 40:
-                level = "Beginner"
-                gap = "High"
-            elif percentage <= 70:
-                level = "Intermediate"
-                gap = "Medium"
-            else:
-                level = "Advanced"
-                gap = "Low"
-
-            # Get skill name
-            skill = db.query(Skill).filter_by(id=skill_id).first()
-            skill_name = skill.name if skill else f"Skill {skill_id}"
-
-            skill_scores[skill_name] = {
-                "score": percentage,
-                "percentage": percentage,
-                "level": level,
-                "gap": gap,
-                "correct_answers": skill_correct,
-                "total_questions": skill_total
-            }
-
-            total_correct += skill_correct
-
-        overall_score = (total_correct / total_questions) * 100 if total_questions > 0 else 0
+        if assessment.result_json is not None:
+            skill_scores = assessment.result_json
+            overall_score = assessment.overall_score or 0
+        else:
+            # Legacy assessment submitted before scores were stored:
+            # score it from its answers
+            answers = (
+                db.query(AssessmentAnswer)
+                .options(selectinload(AssessmentAnswer.question).selectinload(SkillQuestion.skill))
+                .filter_by(assessment_id=assessment.id)
+                .all()
+            )
+
+            # Calculate skill-wise scores
+            skill_scores = {}
+            total_correct = 0
+            total_questions = len(answers)
+
+            # Group answers by skill
+            skill_answers = {}
+            skills_by_id = {}
+            for answer in answers:
+                question = answer.question
+                if question:
+                    skill_id = question.skill_id
+                    if skill_id not in skill_answers:
+                        skill_answers[skill_id] = []
+                        skills_by_id[skill_id] = question.skill
+                    skill_answers[skill_id].append(answer)
+
+            for skill_id, skill_answer_list in skill_answers.items():
+                skill_correct = sum(1 for a in skill_answer_list if a.is_correct)
+                skill_total = len(skill_answer_list)
+                percentage = (skill_correct / skill_total) * 100 if skill_total > 0 else 0
+
+                # Determine level and gap
+                level, gap = classify_percentage(percentage)
+
+                # Get skill name
+                skill = skills_by_id.get(skill_id)
+                skill_name = skill.name if skill else f"Skill {skill_id}"
+
+                skill_scores[skill_name] = {
+                    "score": percentage,
+                    "percentage": percentage,
+                    "level": level,
+                    "gap": gap,
+                    "correct_answers": skill_correct,
+                    "total_questions": skill_total
+                }
+
+                total_correct += skill_correct
+
+            overall_score = (total_correct / total_questions) * 100 if total_questions > 0 else 0
 
         # Generate recommendations based on weak skills
         weak_skills = [skill for skill, data in skill_scores.items() if data["gap"] == "High"]
@@ -357,21 +389,16 @@ def get_assessment_results(user_id: int, db: Session = Depends(get_db)):
         recommendations = []
         learning_path = []
 
+        # Recommendation text and steps are configured per skill
+        skills_by_name = {
+            s.name: s
+            for s in db.query(Skill).filter(Skill.name.in_(weak_skills)).all()
+        } if weak_skills else {}
         for skill_name in weak_skills:
-            if "Database" in skill_name:
-                recommendations.append(f"Learn SQL joins, indexing, and normalization for {skill_name}")
-                learning_path.extend([
-                    "Complete SQL basics course",
-                    "Practice database design with normalization",
-                    "Build projects with complex queries"
-                ])
-            elif "Python" in skill_name:
-                recommendations.append(f"Master Python fundamentals and libraries for {skill_name}")
-                learning_path.extend([
-                    "Learn Python data structures and algorithms",
-                    "Study pandas and numpy libraries",
-                    "Build data analysis projects"
-                ])
+            skill = skills_by_name.get(skill_name)
+            if skill:
+                recommendations.append(skill.get_recommendation())
+                learning_path.extend(skill.get_recommended_steps())
             else:
                 recommendations.append(f"Focus on core concepts and practical applications for {skill_name}")
                 learning_path.append(f"Complete comprehensive {skill_name} training")
@@ -391,8 +418,8 @@ def get_assessment_results(user_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
-@router.post("/submit", status_code=status.HTTP_201_CREATED)
-def submit_assessment(
+@router.post("/submit", status_code=status.HTTP_201_CREATED, operation_id="submit_full_skill_assessment")
+def submit_full_skill_assessment(
     request: SkillsData,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -404,7 +431,7 @@ def submit_assessment(
         return SkillsService.submit_assessment(
             db=db,
             user_id=current_user.id,
-            assessment_payload=request.dict(),
+            assessment_payload={"skills": request.skills},
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -443,7 +470,7 @@ def submit_quiz_answers(
         return SkillsService.submit_quiz_answers(
             db=db,
             user_id=current_user.id,
-            quiz_answers=request.dict(),
+            submission=request,
         )
     except ValueError as e:
        raise HTTPException(status_code=400, detail=str(e))
@@ -482,8 +509,7 @@ def get_all_skills(
     Get all available skills
     """
     try:
-        skills = db.query(Skill).all()
-        return [skill.to_dict() for skill in skills]
+        return SkillsService.get_skill_catalog(db)
     except Exception:
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -497,7 +523,6 @@ def get_assessment(
     Get user's latest skill assessment
     """
     try:
-        from models.skill_assessment import SkillAssessment
         assessment = (
             db.query(SkillAssessment)
             .filter_by(user_id=current_user.id)
@@ -4,12 +4,14 @@ Handles CRUD operations for user notes and code snippets
 """
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, Field
 
 from models.database import get_db
 from models.user import User
 from models.user_note import UserNote
+from models.user_note_tag import UserNoteTag
 from routes.auth_fastapi import get_current_user
 
 router = APIRouter(prefix="/api/notes", tags=["User Notes"])
@@ -71,13 +73,28 @@ def get_user_notes(
     Optional filter by tag.
     """
     try:
-        query = db.query(UserNote).filter(UserNote.user_id == current_user.id)
+        # COUNT(*) OVER () returns the unpaginated total alongside each row,
+        # so the page and its total come back in a single round-trip
+        query = db.query(UserNote, func.count().over().label("total")).filter(
+            UserNote.user_id == current_user.id
+        )
         
         if tag:
-            query = query.filter(UserNote.tags.ilike(f"%{tag}%"))
+            query = query.join(UserNoteTag, UserNoteTag.note_id == UserNote.id).filter(
+                UserNoteTag.user_id == current_user.id,
+                UserNoteTag.tag == tag.strip()
+            )
+        
+        rows = query.order_by(UserNote.created_at.desc()).offset(skip).limit(limit).all()
+        notes = [row[0] for row in rows]
         
-        total = query.count()
-        notes = query.order_by(UserNote.created_at.desc()).offset(skip).limit(limit).all()
+        if rows:
+            total = rows[0].total
+        elif skip:
+            # Page is past the end; the window has no rows to report on
+            total = query.with_entities(func.count(UserNote.id)).scalar()
+        else:
+            total = 0
         
         return {
             "notes": [note.to_dict() for note in notes],
@@ -111,8 +128,12 @@ def create_note(
             learning_path_step_id=note_data.learning_path_step_id,
             tags=note_data.tags
         )
-        return note.to_dict()
+        # Serialize before commit; commit expires the instance
+        payload = note.to_dict()
+        db.commit()
+        return payload
     except Exception as e:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to create note: {str(e)}"
@@ -170,10 +191,12 @@ def update_note(
             note.learning_path_step_id = note_data.learning_path_step_id
         if note_data.tags is not None:
             note.tags = note_data.tags
+            UserNoteTag.replace_for_note(db, note)
         
+        db.flush()
+        payload = note.to_dict()
         db.commit()
-        db.refresh(note)
-        return note.to_dict()
+        return payload
     except Exception as e:
         db.rollback()
         raise HTTPException(
@@ -191,16 +214,29 @@ def delete_note(
     """
     Delete a specific note.
     """
-    note = UserNote.find_by_id(db, note_id, user_id=current_user.id)
-    if not note:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Note not found"
-        )
-    
     try:
-        db.delete(note)
+        # Plain DELETE statements; no SELECT to load the note first.
+        # Tag rows are removed explicitly since SQLite doesn't enforce the
+        # ON DELETE CASCADE foreign key by default.
+        db.query(UserNoteTag).filter(
+            UserNoteTag.note_id == note_id,
+            UserNoteTag.user_id == current_user.id
+        ).delete(synchronize_session=False)
+        deleted = db.query(UserNote).filter(
+            UserNote.id == note_id,
+            UserNote.user_id == current_user.id
+        ).delete(synchronize_session=False)
+        
+        if not deleted:
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Note not found"
+            )
+        
         db.commit()
+    except HTTPException:
+        raise
     except Exception as e:
         db.rollback()
         raise HTTPException(
@@ -219,18 +255,7 @@ def search_notes(
     Search notes by title, content, or tags.
     """
     try:
-        from sqlalchemy import or_
-        
-        search_filter = or_(
-            UserNote.title.ilike(f"%{query}%"),
-            UserNote.content.ilike(f"%{query}%"),
-            UserNote.tags.ilike(f"%{query}%")
-        )
-        
-        notes = db.query(UserNote).filter(
-            UserNote.user_id == current_user.id,
-            search_filter
-        ).order_by(UserNote.created_at.desc()).all()
+        notes = UserNote.search(db, current_user.id, query)
         
         return {
             "notes": [note.to_dict() for note in notes],
@@ -252,20 +277,13 @@ def get_all_tags(
     Get all unique tags used by the current user.
     """
     try:
-        notes = db.query(UserNote).filter(
-            UserNote.user_id == current_user.id,
-            UserNote.tags.isnot(None)
-        ).all()
-        
-        # Extract and deduplicate tags
-        all_tags = set()
-        for note in notes:
-            if note.tags:
-                tags = [tag.strip() for tag in note.tags.split(",")]
-                all_tags.update(tags)
+        # Distinct tags come straight off the (user_id, tag) index
+        rows = db.query(UserNoteTag.tag).filter(
+            UserNoteTag.user_id == current_user.id
+        ).distinct().order_by(UserNoteTag.tag).all()
         
         return {
-            "tags": sorted(list(all_tags))
+            "tags": [row.tag for row in rows]
         }
     except Exception as e:
         raise HTTPException(
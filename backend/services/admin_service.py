@@ -1,13 +1,50 @@
+import threading
 from typing import List, Dict, Any, Optional
-from sqlalchemy.orm import Session
+
+from cachetools import TTLCache
+from sqlalchemy import and_, bindparam, exists, func, literal_column, select
+from sqlalchemy.orm import Session, raiseload, selectinload
 from sqlalchemy.exc import IntegrityError
 
+from models.database import STRICT_LOADING
 from models.user import User
+from models.user_skill import UserSkill
 from models.skill import Skill
 from models.job_role import JobRole
 from models.role_skill_requirement import RoleSkillRequirement
+from models.skill_assessment import SkillAssessment
+from services.career_service import CareerService
+from services.skills_service import SkillsService
+
+
+# Per-process cache of user_id -> role for admin checks. Roles change rarely;
+# role updates evict the entry, other workers catch up within the TTL.
+ROLE_CACHE_TTL_SECONDS = 30
+_role_cache = TTLCache(maxsize=1024, ttl=ROLE_CACHE_TTL_SECONDS)
+_role_cache_lock = threading.Lock()
+
+VALID_REQUIRED_LEVELS = frozenset({"beginner", "intermediate", "advanced", "expert"})
+VALID_ROLE_LEVELS = frozenset({"junior", "mid", "senior"})
+
+# Admin listings: largest page served, and rows fetched per driver round
+MAX_PAGE_SIZE = 1000
+PAGE_FETCH_BATCH = 500
 
 
+# Built once; SQLAlchemy's compiled cache then reuses its SQL on every call
+_SELECT_USER_ROLE = select(User.role).where(User.id == bindparam("user_id"))
+
+
+def _cached_role(db: Session, user_id: int) -> Optional[str]:
+    with _role_cache_lock:
+        role = _role_cache.get(user_id)
+    if role is None:
+        role = db.execute(_SELECT_USER_ROLE, {"user_id": user_id}).scalar()
+        if role is not None:
+            with _role_cache_lock:
+                _role_cache[user_id] = role
+    return role
+
 
 class AdminService:
     """
@@ -20,9 +57,82 @@ class AdminService:
     # --------------------------------------------------
     @staticmethod
     def _require_admin(db: Session, user_id: int) -> None:
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user or user.role != "admin":
+        if _cached_role(db, user_id) != "admin":
+            raise PermissionError("Admin permissions required")
+
+    @staticmethod
+    def _require_admin_and_load(db: Session, user_id: int, model, *criteria):
+        """
+        Admin check and target lookup in one round-trip: the admin's user row
+        LEFT JOINed to the target. No row means not an admin; a NULL target
+        means it doesn't exist. A cached admin role skips the join.
+        """
+        with _role_cache_lock:
+            cached_role = _role_cache.get(user_id)
+        if cached_role == "admin":
+            return db.query(model).filter(*criteria).first()
+
+        row = (
+            db.query(User.id, model)
+            .select_from(User)
+            .outerjoin(model, and_(*criteria))
+            .filter(User.id == user_id, User.role == "admin")
+            .first()
+        )
+        if row is None:
+            raise PermissionError("Admin permissions required")
+        with _role_cache_lock:
+            _role_cache[user_id] = "admin"
+        return row[1]
+
+    @staticmethod
+    def _require_admin_and_load_for_delete(db: Session, user_id: int, model, target_criteria, usage_criteria):
+        """
+        _require_admin_and_load plus an EXISTS over the rows that would block
+        the delete, so admin check, target lookup and usage probe share one
+        statement. Returns (target, in_use).
+        """
+        row = (
+            db.query(User.id, model, exists().where(usage_criteria).label("in_use"))
+            .select_from(User)
+            .outerjoin(model, target_criteria)
+            .filter(User.id == user_id, User.role == "admin")
+            .first()
+        )
+        if row is None:
             raise PermissionError("Admin permissions required")
+        with _role_cache_lock:
+            _role_cache[user_id] = "admin"
+        return row[1], bool(row.in_use)
+
+    @staticmethod
+    def _exists(db: Session, *criteria) -> bool:
+        """SELECT 1 ... LIMIT 1 probe; no ORM row is built."""
+        stmt = select(literal_column("1")).where(*criteria).limit(1)
+        return db.execute(stmt).first() is not None
+
+    @staticmethod
+    def _insert_unique(db: Session, obj, duplicate_message: str, *criteria) -> None:
+        """
+        Insert and flush, letting the table's unique constraint catch
+        duplicates instead of a SELECT beforehand. The probe only runs on
+        failure, to tell a duplicate from any other integrity error.
+        The caller commits.
+        """
+        db.add(obj)
+        try:
+            db.flush()
+        except IntegrityError:
+            db.rollback()
+            if AdminService._exists(db, *criteria):
+                raise ValueError(duplicate_message)
+            raise
+
+    @staticmethod
+    def invalidate_cached_role(user_id: int) -> None:
+        """Drop a user's cached role after it changes."""
+        with _role_cache_lock:
+            _role_cache.pop(user_id, None)
 
     # --------------------------------------------------
     # SKILLS
@@ -41,12 +151,10 @@ class AdminService:
 
         if not name or not name.strip():
             raise ValueError("Skill name is required")
-
-        if db.query(Skill).filter(Skill.name == name.strip()).first():
-            raise ValueError("Skill with this name already exists")
+        name = name.strip()
 
         skill = Skill(
-            name=name.strip(),
+            name=name,
             description=description.strip() if description else None,
             category_id=category_id,
         )
@@ -54,11 +162,14 @@ class AdminService:
         if depends_on is not None:
             skill.set_depends_on(depends_on)
 
-        db.add(skill)
+        AdminService._insert_unique(
+            db, skill, "Skill with this name already exists", Skill.name == name
+        )
+        payload = {"skill": skill.to_dict()}
         db.commit()
-        db.refresh(skill)
+        SkillsService.invalidate_skill_catalog()
 
-        return {"skill": skill.to_dict()}
+        return payload
 
     @staticmethod
     def update_skill(
@@ -71,9 +182,9 @@ class AdminService:
         depends_on: Optional[List[int]] = None,
     ) -> Dict[str, Any]:
 
-        AdminService._require_admin(db, admin_user_id)
-
-        skill = db.query(Skill).filter(Skill.id == skill_id).first()
+        skill = AdminService._require_admin_and_load(
+            db, admin_user_id, Skill, Skill.id == skill_id
+        )
         if not skill:
             raise ValueError("Skill not found")
 
@@ -81,7 +192,7 @@ class AdminService:
             name = name.strip()
             if not name:
                 raise ValueError("Skill name cannot be empty")
-            if db.query(Skill).filter(Skill.name == name, Skill.id != skill_id).first():
+            if name != skill.name and AdminService._exists(db, Skill.name == name, Skill.id != skill_id):
                 raise ValueError("Skill name already exists")
             skill.name = name
 
@@ -94,10 +205,17 @@ class AdminService:
         if depends_on is not None:
             skill.set_depends_on(depends_on)
 
+        # Nothing changed: skip the flush, commit and cache invalidation
+        if not db.is_modified(skill):
+            return {"skill": skill.to_dict()}
+
+        db.flush()
+        payload = {"skill": skill.to_dict()}
         db.commit()
-        db.refresh(skill)
+        SkillsService.invalidate_skill_catalog()
+        CareerService.invalidate_role_catalog()
 
-        return {"skill": skill.to_dict()}
+        return payload
 
     @staticmethod
     def delete_skill(
@@ -106,19 +224,21 @@ class AdminService:
         skill_id: int
     ) -> Dict[str, Any]:
 
-        AdminService._require_admin(db, admin_user_id)
-
-        skill = db.query(Skill).filter(Skill.id == skill_id).first()
+        skill, in_use = AdminService._require_admin_and_load_for_delete(
+            db, admin_user_id, Skill,
+            Skill.id == skill_id,
+            RoleSkillRequirement.skill_id == skill_id,
+        )
         if not skill:
             raise ValueError("Skill not found")
 
-        if db.query(RoleSkillRequirement).filter(
-            RoleSkillRequirement.skill_id == skill_id
-        ).first():
+        if in_use:
             raise ValueError("Skill is used in job roles")
 
         db.delete(skill)
         db.commit()
+        SkillsService.invalidate_skill_catalog()
+        CareerService.invalidate_role_catalog()
 
         return {"message": "Skill deleted successfully"}
 
@@ -140,9 +260,6 @@ class AdminService:
         if not title:
             raise ValueError("Role title required")
 
-        if db.query(JobRole).filter(JobRole.title == title).first():
-            raise ValueError("Role already exists")
-
         role = JobRole(
             title=title,
             description=description.strip() if description else None,
@@ -151,11 +268,14 @@ class AdminService:
         if salary_range:
             role.set_average_salary(salary_range)
 
-        db.add(role)
+        AdminService._insert_unique(
+            db, role, "Role already exists", JobRole.title == title
+        )
+        payload = {"role": role.to_dict()}
         db.commit()
-        db.refresh(role)
+        CareerService.invalidate_role_catalog()
 
-        return {"role": role.to_dict()}
+        return payload
     
     @staticmethod
     def update_job_role(
@@ -168,9 +288,9 @@ class AdminService:
         salary_range: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
 
-        AdminService._require_admin(db, admin_user_id)
-
-        role = db.query(JobRole).filter(JobRole.id == role_id).first()
+        role = AdminService._require_admin_and_load(
+            db, admin_user_id, JobRole, JobRole.id == role_id
+        )
         if not role:
             raise ValueError("Job role not found")
 
@@ -178,10 +298,7 @@ class AdminService:
             title = title.strip()
             if not title:
                 raise ValueError("Role title cannot be empty")
-            if db.query(JobRole).filter(
-                JobRole.title == title,
-                JobRole.id != role_id
-            ).first():
+            if title != role.title and AdminService._exists(db, JobRole.title == title, JobRole.id != role_id):
                 raise ValueError("Role title already exists")
             role.title = title
 
@@ -189,18 +306,23 @@ class AdminService:
             role.description = description.strip() if description else None
 
         if level is not None:
-            valid_levels = {"junior", "mid", "senior"}
-            if level not in valid_levels:
+            if level not in VALID_ROLE_LEVELS:
                 raise ValueError("Invalid role level")
             role.level = level
 
         if salary_range is not None:
             role.set_average_salary(salary_range)
 
+        # Nothing changed: skip the flush and commit
+        if not db.is_modified(role):
+            return {"role": role.to_dict()}
+
+        db.flush()
+        payload = {"role": role.to_dict()}
         db.commit()
-        db.refresh(role)
+        CareerService.invalidate_role_catalog()
 
-        return {"role": role.to_dict()}
+        return payload
 
     @staticmethod
     def delete_job_role(
@@ -209,19 +331,20 @@ class AdminService:
         role_id: int
     ) -> Dict[str, Any]:
 
-        AdminService._require_admin(db, admin_user_id)
-
-        role = db.query(JobRole).filter(JobRole.id == role_id).first()
+        role, in_use = AdminService._require_admin_and_load_for_delete(
+            db, admin_user_id, JobRole,
+            JobRole.id == role_id,
+            RoleSkillRequirement.role_id == role_id,
+        )
         if not role:
             raise ValueError("Role not found")
 
-        if db.query(RoleSkillRequirement).filter(
-            RoleSkillRequirement.role_id == role_id
-        ).first():
+        if in_use:
             raise ValueError("Role has skill requirements")
 
         db.delete(role)
         db.commit()
+        CareerService.invalidate_role_catalog()
 
         return {"message": "Job role deleted"}
 
@@ -243,16 +366,10 @@ class AdminService:
         if not (0.0 <= weight <= 1.0):
             raise ValueError("Weight must be between 0.0 and 1.0")
 
-        valid_levels = {"beginner", "intermediate", "advanced", "expert"}
-        if required_level not in valid_levels:
+        required_level = required_level.lower()
+        if required_level not in VALID_REQUIRED_LEVELS:
             raise ValueError("Invalid required level")
 
-        if db.query(RoleSkillRequirement).filter_by(
-            role_id=role_id,
-            skill_id=skill_id
-        ).first():
-            raise ValueError("Requirement already exists")
-
         req = RoleSkillRequirement(
             role_id=role_id,
             skill_id=skill_id,
@@ -260,11 +377,16 @@ class AdminService:
             weight=weight,
         )
 
-        db.add(req)
+        AdminService._insert_unique(
+            db, req, "Requirement already exists",
+            RoleSkillRequirement.role_id == role_id,
+            RoleSkillRequirement.skill_id == skill_id,
+        )
+        payload = {"requirement": req.to_dict()}
         db.commit()
-        db.refresh(req)
+        CareerService.invalidate_role_catalog()
 
-        return {"requirement": req.to_dict()}
+        return payload
 
     @staticmethod
     def update_skill_weight(
@@ -275,24 +397,25 @@ class AdminService:
         weight: float,
     ) -> Dict[str, Any]:
 
-        AdminService._require_admin(db, admin_user_id)
-
         if not (0.0 <= weight <= 1.0):
             raise ValueError("Weight must be between 0.0 and 1.0")
 
-        req = db.query(RoleSkillRequirement).filter_by(
-            role_id=role_id,
-            skill_id=skill_id
-        ).first()
+        req = AdminService._require_admin_and_load(
+            db, admin_user_id, RoleSkillRequirement,
+            RoleSkillRequirement.role_id == role_id,
+            RoleSkillRequirement.skill_id == skill_id,
+        )
 
         if not req:
             raise ValueError("Requirement not found")
 
         req.weight = weight
+        db.flush()
+        payload = {"requirement": req.to_dict()}
         db.commit()
-        db.refresh(req)
+        CareerService.invalidate_role_catalog()
 
-        return {"requirement": req.to_dict()}
+        return payload
 
     @staticmethod
     def remove_skill_requirement(
@@ -302,18 +425,18 @@ class AdminService:
         skill_id: int
     ) -> Dict[str, Any]:
 
-        AdminService._require_admin(db, admin_user_id)
-
-        req = db.query(RoleSkillRequirement).filter_by(
-            role_id=role_id,
-            skill_id=skill_id
-        ).first()
+        req = AdminService._require_admin_and_load(
+            db, admin_user_id, RoleSkillRequirement,
+            RoleSkillRequirement.role_id == role_id,
+            RoleSkillRequirement.skill_id == skill_id,
+        )
 
         if not req:
             raise ValueError("Requirement not found")
 
         db.delete(req)
         db.commit()
+        CareerService.invalidate_role_catalog()
 
         return {"message": "Requirement removed"}
 
@@ -329,22 +452,36 @@ class AdminService:
         """
         Get all users with pagination
         """
-        users = db.query(User).offset(skip).limit(limit).all()
-        total = db.query(User).count()
-        
+        limit = min(max(limit, 1), MAX_PAGE_SIZE)
+
+        # Plain column rows (no ORM hydration), fetched in batches;
+        # COUNT(*) OVER () carries the total on every row of the page
+        result = db.execute(
+            select(
+                User.id,
+                User.email,
+                User.name,
+                User.role,
+                User.current_role.label("currentRole"),
+                User.created_at,
+                User.updated_at,
+                func.count().over().label("total"),
+            )
+            .offset(skip)
+            .limit(limit)
+            .execution_options(yield_per=PAGE_FETCH_BATCH)
+        ).mappings()
+
+        users = []
+        total = None
+        for row in result:
+            total = row["total"]
+            users.append({key: value for key, value in row.items() if key != "total"})
+        if total is None:
+            total = db.query(func.count(User.id)).scalar()
+
         return {
-            "users": [
-                {
-                    "id": user.id,
-                    "email": user.email,
-                    "name": user.name,
-                    "role": user.role,
-                    "currentRole": getattr(user, 'currentRole', None),
-                    "created_at": getattr(user, 'created_at', None),
-                    "updated_at": getattr(user, 'updated_at', None),
-                }
-                for user in users
-            ],
+            "users": users,
             "total": total,
             "page": (skip // limit) + 1,
             "limit": limit
@@ -358,30 +495,43 @@ class AdminService:
         """
         Get detailed information about a specific user
         """
-        user = db.query(User).filter(User.id == user_id).first()
+        # User, skills (with skill names) and assessments from one dispatch:
+        # the user row plus one IN query per collection
+        load_options = [
+            selectinload(User.skills).selectinload(UserSkill.skill),
+            # Only the columns the response uses
+            selectinload(User.assessments).load_only(
+                SkillAssessment.id,
+                SkillAssessment.status,
+                SkillAssessment.completed_at,
+            ),
+        ]
+        if STRICT_LOADING:
+            load_options.append(raiseload("*"))
+        user = (
+            db.query(User)
+            .options(*load_options)
+            .filter(User.id == user_id)
+            .first()
+        )
         if not user:
             raise ValueError("User not found")
 
-        # Get user's skills
-        from models.user_skill import UserSkill
-        user_skills = db.query(UserSkill).filter(UserSkill.user_id == user_id).all()
-        
-        # Get user's assessments
-        from models.skill_assessment import SkillAssessment
-        assessments = db.query(SkillAssessment).filter(SkillAssessment.user_id == user_id).all()
+        user_skills = user.skills
+        assessments = user.assessments
 
         return {
             "id": user.id,
             "email": user.email,
             "name": user.name,
             "role": user.role,
-            "currentRole": getattr(user, 'currentRole', None),
-            "created_at": getattr(user, 'created_at', None),
-            "updated_at": getattr(user, 'updated_at', None),
+            "currentRole": user.current_role,
+            "created_at": user.created_at,
+            "updated_at": user.updated_at,
             "skills": [
                 {
-                    "name": skill.skill.name if hasattr(skill, 'skill') else f"Skill {skill.skill_id}",
-                    "level": skill.inferred_level,
+                    "name": skill.skill.name if skill.skill else f"Skill {skill.skill_id}",
+                    "level": skill.level,
                     "confidence": skill.confidence
                 }
                 for skill in user_skills
@@ -416,10 +566,7 @@ class AdminService:
             raise ValueError("User not found")
 
         user.role = new_role
-        db.commit()
-        db.refresh(user)
-
-        return {
+        payload = {
             "message": "User role updated successfully",
             "user": {
                 "id": user.id,
@@ -428,6 +575,10 @@ class AdminService:
                 "role": user.role
             }
         }
+        db.commit()
+        AdminService.invalidate_cached_role(user_id)
+
+        return payload
 
     # --------------------------------------------------
     # ASSESSMENTS
@@ -441,25 +592,45 @@ class AdminService:
         """
         Get all skill assessments with pagination
         """
-        from models.skill_assessment import SkillAssessment
-        
-        assessments = db.query(SkillAssessment).offset(skip).limit(limit).all()
-        total = db.query(SkillAssessment).count()
+        limit = min(max(limit, 1), MAX_PAGE_SIZE)
+
+        result = db.execute(
+            select(
+                SkillAssessment.id,
+                SkillAssessment.user_id,
+                User.name.label("user_name"),
+                User.email.label("user_email"),
+                SkillAssessment.status,
+                SkillAssessment.completed_at,
+                func.count().over().label("total"),
+            )
+            .select_from(SkillAssessment)
+            .outerjoin(User, User.id == SkillAssessment.user_id)
+            .offset(skip)
+            .limit(limit)
+            .execution_options(yield_per=PAGE_FETCH_BATCH)
+        )
+
+        assessments = []
+        total = None
+        for row in result:
+            total = row.total
+            assessments.append({
+                "id": row.id,
+                "user_id": row.user_id,
+                "user_name": row.user_name or "Unknown",
+                "user_email": row.user_email or "Unknown",
+                # Assessments span several skills and carry no single score
+                "skill_name": "Unknown",
+                "score": 0,
+                "status": row.status,
+                "completed_at": row.completed_at,
+            })
+        if total is None:
+            total = db.query(func.count(SkillAssessment.id)).scalar()
 
         return {
-            "assessments": [
-                {
-                    "id": assessment.id,
-                    "user_id": assessment.user_id,
-                    "user_name": assessment.user.name if hasattr(assessment, 'user') and assessment.user else "Unknown",
-                    "user_email": assessment.user.email if hasattr(assessment, 'user') and assessment.user else "Unknown",
-                    "skill_name": assessment.skill.name if hasattr(assessment, 'skill') and assessment.skill else "Unknown",
-                    "score": getattr(assessment, 'score', 0),
-                    "status": assessment.status,
-                    "completed_at": assessment.completed_at,
-                }
-                for assessment in assessments
-            ],
+            "assessments": assessments,
             "total": total,
             "page": (skip // limit) + 1,
             "limit": limit
@@ -473,21 +644,25 @@ class AdminService:
         """
         Get system statistics
         """
-        total_users = db.query(User).count()
-        total_skills = db.query(Skill).count()
-        total_roles = db.query(JobRole).count()
-        
-        from models.skill_assessment import SkillAssessment
-        total_assessments = db.query(SkillAssessment).count()
-        completed_assessments = db.query(SkillAssessment).filter(
-            SkillAssessment.status == "completed"
-        ).count()
+        # All five counts as scalar subqueries of one SELECT
+        counts = db.execute(
+            select(
+                select(func.count(User.id)).scalar_subquery().label("total_users"),
+                select(func.count(Skill.id)).scalar_subquery().label("total_skills"),
+                select(func.count(JobRole.id)).scalar_subquery().label("total_roles"),
+                select(func.count(SkillAssessment.id)).scalar_subquery().label("total_assessments"),
+                select(func.count(SkillAssessment.id))
+                .where(SkillAssessment.status == "completed")
+                .scalar_subquery()
+                .label("completed_assessments"),
+            )
+        ).one()
 
         return {
-            "total_users": total_users,
-            "total_skills": total_skills,
-            "total_roles": total_roles,
-            "total_assessments": total_assessments,
-            "completed_assessments": completed_assessments,
+            "total_users": counts.total_users,
+            "total_skills": counts.total_skills,
+            "total_roles": counts.total_roles,
+            "total_assessments": counts.total_assessments,
+            "completed_assessments": counts.completed_assessments,
             "system_health": "healthy"
         }
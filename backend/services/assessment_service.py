@@ -1,14 +1,15 @@
+import logging
 import random
-from datetime import datetime, timedelta
 from typing import List, Dict, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy import and_, select
 
 from models.skill import Skill
 from models.skill_question import SkillQuestion
 from models.skill_assessment import SkillAssessment, SkillAssessmentSkill, UserAnswer
 from models.user_skill import UserSkill
 from models.domain import Domain
+from services.skills_service import classify_percentage
 from schemas.assessment import (
     InitializeAssessmentRequest,
     StartSkillQuizRequest,
@@ -22,6 +23,8 @@ from schemas.assessment import (
     QuizResult
 )
 
+logger = logging.getLogger(__name__)
+
 
 class AssessmentService:
 
@@ -35,14 +38,16 @@ class AssessmentService:
         Initialize assessment by validating domain and skills
         """
         # Validate domain exists
-        domain = db.query(Domain).filter(Domain.id == request.domain_id).first()
+        domain = db.get(Domain, request.domain_id)
         if not domain:
             raise ValueError(f"Domain {request.domain_id} not found")
 
         # Validate all skills exist and belong to the domain
-        skills = db.query(Skill).filter(
-            and_(Skill.id.in_(request.skill_ids), Skill.domain_id == request.domain_id)
-        ).all()
+        skills = db.execute(
+            select(Skill).where(
+                and_(Skill.id.in_(request.skill_ids), Skill.domain_id == request.domain_id)
+            )
+        ).scalars().all()
 
         if len(skills) != len(request.skill_ids):
             found_ids = {skill.id for skill in skills}
@@ -84,21 +89,32 @@ class AssessmentService:
         """
         Get selected skills for current assessment
         """
-        if assessment_id:
-            assessment = db.query(SkillAssessment).filter(
-                and_(SkillAssessment.id == assessment_id, SkillAssessment.user_id == user_id)
-            ).first()
-            if not assessment:
-                raise ValueError("Assessment not found")
-
-            # Get skills from assessment_skills
-            skill_ids = [s.skill_id for s in assessment.assessment_skills]
-        else:
+        if not assessment_id:
             # Get from session storage (not available in backend)
             # This would need to be stored in assessment record
             raise ValueError("Assessment ID required")
 
-        skills = db.query(Skill).filter(Skill.id.in_(skill_ids)).all()
+        # Skills of the user's assessment in a single statement. Retakes add
+        # more rows for the same skill, so filter with IN rather than joining
+        skills = db.execute(
+            select(Skill).where(
+                Skill.id.in_(
+                    select(SkillAssessmentSkill.skill_id).join(
+                        SkillAssessment, SkillAssessment.id == SkillAssessmentSkill.assessment_id
+                    ).where(
+                        and_(SkillAssessment.id == assessment_id, SkillAssessment.user_id == user_id)
+                    )
+                )
+            )
+        ).scalars().all()
+
+        # No rows can also mean the assessment doesn't exist for this user
+        if not skills and db.execute(
+            select(SkillAssessment.id).where(
+                and_(SkillAssessment.id == assessment_id, SkillAssessment.user_id == user_id)
+            )
+        ).scalar() is None:
+            raise ValueError("Assessment not found")
 
         skill_infos = [
             SkillInfo(
@@ -123,25 +139,39 @@ class AssessmentService:
         Start quiz for a specific skill with randomized questions
         """
         # Validate skill exists
-        skill = db.query(Skill).filter(Skill.id == request.skill_id).first()
+        skill = db.get(Skill, request.skill_id)
         if not skill:
             raise ValueError(f"Skill {request.skill_id} not found")
 
         # Check if user has access to this skill (has it in their assessment)
         # For now, allow all skills - in production, check assessment record
 
-        # Get random 10 questions for the skill
-        questions = db.query(SkillQuestion).filter(
-            SkillQuestion.skill_id == request.skill_id
-        ).all()
+        # Sample over the ids only, then load just the chosen questions
+        question_ids = db.execute(
+            select(SkillQuestion.id).where(SkillQuestion.skill_id == request.skill_id)
+        ).scalars().all()
 
-        if len(questions) == 0:
+        if len(question_ids) == 0:
             raise ValueError(f"No questions available for skill {request.skill_id}")
 
         # Randomize and limit to 10 (or fewer if not enough questions)
-        num_questions = min(len(questions), 10)
-        selected_questions = random.sample(questions, num_questions)
-
+        num_questions = min(len(question_ids), 10)
+        chosen_ids = random.sample(question_ids, num_questions)
+
+        questions_by_id = {
+            q.id: q for q in db.execute(
+                select(SkillQuestion).options(
+                    load_only(
+                        SkillQuestion.id,
+                        SkillQuestion.question_text,
+                        SkillQuestion.options,
+                        SkillQuestion.difficulty,
+                    )
+                ).where(SkillQuestion.id.in_(chosen_ids))
+            ).scalars()
+        }
+        # IN returns rows in index order; keep the sampled order
+        selected_questions = [questions_by_id[qid] for qid in chosen_ids]
 
         # Convert to response format
         question_responses = [
@@ -174,20 +204,27 @@ class AssessmentService:
             raise ValueError("Skill ID is required to submit quiz")
         
         # Validate skill exists
-        skill = db.query(Skill).filter(Skill.id == request.skill_id).first()
+        skill = db.get(Skill, request.skill_id)
         if not skill:
             raise ValueError(f"Skill {request.skill_id} not found")
 
 
-        # Get all questions for this skill
-        questions = db.query(SkillQuestion).filter(
-            SkillQuestion.skill_id == request.skill_id
-        ).all()
+        # Correct answers for just the submitted questions of this skill
+        correct_by_question = dict(
+            db.execute(
+                select(SkillQuestion.id, SkillQuestion.correct_answer).where(
+                    SkillQuestion.skill_id == request.skill_id,
+                    SkillQuestion.id.in_(list(request.answers.keys()))
+                )
+            ).all()
+        ) if request.answers else {}
 
         # Create or get assessment
-        assessment = db.query(SkillAssessment).filter(
-            and_(SkillAssessment.user_id == user_id, SkillAssessment.status == 'in_progress')
-        ).first()
+        assessment = db.execute(
+            select(SkillAssessment).where(
+                and_(SkillAssessment.user_id == user_id, SkillAssessment.status == 'in_progress')
+            ).limit(1)
+        ).scalars().first()
 
         if not assessment:
             assessment = SkillAssessment(
@@ -201,84 +238,60 @@ class AssessmentService:
         total_questions = len(request.answers)
         correct_answers = 0
 
-        # Debug logging
-        print(f"DEBUG: Processing {total_questions} answers for skill {request.skill_id}")
-        print(f"DEBUG: Available questions: {[q.id for q in questions]}")
+        logger.debug(
+            "scoring %s answers for skill %s (%s known questions)",
+            total_questions, request.skill_id, len(correct_by_question)
+        )
 
         # Store answers
+        answer_rows = []
         for question_id, user_answer in request.answers.items():
-            question = next((q for q in questions if q.id == question_id), None)
-            if not question:
-                print(f"DEBUG: Question {question_id} not found in available questions")
+            correct_answer = correct_by_question.get(question_id)
+            if correct_answer is None:
+                logger.debug("question %s not found for skill %s", question_id, request.skill_id)
                 continue
 
             # Normalize answers for comparison (strip whitespace, case-insensitive for text)
             normalized_user = str(user_answer).strip()
-            normalized_correct = str(question.correct_answer).strip()
+            normalized_correct = str(correct_answer).strip()
             
             is_correct = normalized_user == normalized_correct
-            
-            print(f"DEBUG: Q{question_id}: User='{normalized_user}' | Correct='{normalized_correct}' | Match={is_correct}")
 
             if is_correct:
                 correct_answers += 1
 
-            # Store user answer
-            user_answer_record = UserAnswer(
-                assessment_id=assessment.id,
-                skill_id=request.skill_id,
-                question_id=question_id,
-                user_answer=user_answer,
-                is_correct='true' if is_correct else 'false'
-            )
-            db.add(user_answer_record)
+            answer_rows.append({
+                "assessment_id": assessment.id,
+                "skill_id": request.skill_id,
+                "question_id": question_id,
+                "user_answer": user_answer,
+                "is_correct": is_correct,
+            })
+
+        # One multi-row INSERT for all answers
+        if answer_rows:
+            db.bulk_insert_mappings(UserAnswer, answer_rows)
 
         percentage = (correct_answers / total_questions) * 100 if total_questions > 0 else 0
-        print(f"DEBUG: Final score: {correct_answers}/{total_questions} = {percentage}%")
+        logger.debug("quiz score %s/%s = %s%%", correct_answers, total_questions, percentage)
 
 
         # Determine level
-        if percentage <= 40:
-            level = "Beginner"
-        elif percentage <= 70:
-            level = "Intermediate"
-        else:
-            level = "Advanced"
+        level, _ = classify_percentage(percentage)
 
         # Update or create user skill record
-        user_skill = db.query(UserSkill).filter(
-            and_(UserSkill.user_id == user_id, UserSkill.skill_id == request.skill_id)
-        ).first()
-
-        confidence_updated = False
-        if user_skill:
-            # Update confidence using formula: new_confidence = (old_confidence * 0.4) + (percentage * 0.6)
-            old_confidence = user_skill.confidence
-            new_confidence = int((old_confidence * 0.4) + (percentage * 0.6))
-            new_confidence = max(0, min(100, new_confidence))  # Clamp to 0-100
-
-            user_skill.confidence = new_confidence
-            user_skill.score = percentage
-            user_skill.level = level.lower()
-            user_skill.assessed_at = datetime.utcnow()
-            confidence_updated = True
-        else:
-            # Create new user skill record
-            user_skill = UserSkill(
-                user_id=user_id,
-                skill_id=request.skill_id,
-                level=level.lower(),
-                confidence=int(percentage),
-                score=percentage
-            )
-            db.add(user_skill)
+        confidence_updated = UserSkill.upsert_quiz_result(
+            db, user_id, request.skill_id, level.lower(), percentage
+        )
 
-        # Store assessment skill result
+        # Store assessment skill result, copying the confidence just written
         assessment_skill = SkillAssessmentSkill(
             assessment_id=assessment.id,
             skill_id=request.skill_id,
             level=level.lower(),
-            confidence=user_skill.confidence,
+            confidence=select(UserSkill.confidence).where(
+                and_(UserSkill.user_id == user_id, UserSkill.skill_id == request.skill_id)
+            ).scalar_subquery(),
             score=percentage
         )
         db.add(assessment_skill)
@@ -320,24 +333,27 @@ class AssessmentService:
         """
         Get assessment result for a specific skill
         """
-        # Get latest assessment for this user and skill
-        assessment_skill = db.query(SkillAssessmentSkill).join(SkillAssessment).filter(
-            and_(
-                SkillAssessment.user_id == user_id,
-                SkillAssessmentSkill.skill_id == skill_id
-            )
-        ).order_by(SkillAssessment.created_at.desc()).first()
+        # Latest assessment for this user and skill, with the skill name
+        # joined in
+        row = db.execute(
+            select(SkillAssessmentSkill, Skill.name).join(SkillAssessment).join(
+                Skill, Skill.id == SkillAssessmentSkill.skill_id
+            ).where(
+                and_(
+                    SkillAssessment.user_id == user_id,
+                    SkillAssessmentSkill.skill_id == skill_id
+                )
+            ).order_by(SkillAssessment.created_at.desc()).limit(1)
+        ).first()
 
-        if not assessment_skill:
+        if not row:
             raise ValueError(f"No assessment found for skill {skill_id}")
 
-        skill = db.query(Skill).filter(Skill.id == skill_id).first()
-        if not skill:
-            raise ValueError(f"Skill {skill_id} not found")
+        assessment_skill, skill_name = row
 
         return AssessmentResultResponse(
             skill_id=skill_id,
-            skill_name=skill.name,
+            skill_name=skill_name,
             score=assessment_skill.score,
             percentage=assessment_skill.score,
             level=assessment_skill.level.title(),
@@ -1,14 +1,62 @@
-from typing import List, Dict, Any, Optional
-from sqlalchemy.orm import Session
+import heapq
+import threading
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Tuple
+
+from cachetools import TTLCache
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
 from sqlalchemy import func, desc
 
+from models.database import STRICT_LOADING
 from models.job_role import JobRole
 from models.role_skill_requirement import RoleSkillRequirement
 from models.user_skill import UserSkill
 from models.skill_assessment import SkillAssessmentSkill, SkillAssessment
-from models.domain import Domain
-from ai.career_scoring import CareerScoring
+from ai.career_scoring import CareerScoring, level_to_score
+
+
+# Per-process snapshot of every role with its requirements. Roles are
+# reference data that only admins change; admin writes evict the snapshot,
+# other workers catch up within the TTL.
+ROLE_CATALOG_TTL_SECONDS = 300
+_ROLE_CATALOG_KEY = "roles"
+_role_catalog_cache = TTLCache(maxsize=1, ttl=ROLE_CATALOG_TTL_SECONDS)
+_role_catalog_lock = threading.Lock()
+
+# Outside production, touching a relationship the career queries didn't
+# eager-load raises instead of quietly issuing one SELECT per row
+_STRICT_LOAD_OPTIONS = (raiseload("*"),) if STRICT_LOADING else ()
+
 
+# Plain-value copies of the ORM rows, safe to share across sessions.
+# Attribute names match the models so CareerScoring can take them as-is.
+@dataclass(frozen=True)
+class CatalogSkill:
+    id: int
+    name: str
+    description: Optional[str]
+
+
+@dataclass(frozen=True)
+class CatalogRequirement:
+    skill_id: int
+    required_level: str
+    required_score: int
+    weight: float
+    skill: Optional[CatalogSkill]
+
+
+@dataclass(frozen=True)
+class CatalogRole:
+    id: int
+    title: str
+    description: Optional[str]
+    level: str
+    domain_id: Optional[int]
+    domain_name: Optional[str]
+    demand_score: float
+    growth_rate: float
+    role_skill_requirements: Tuple[CatalogRequirement, ...]
 
 
 class CareerService:
@@ -44,16 +92,72 @@ class CareerService:
             "user_domain_id": user_domain_id
         }
 
+    @staticmethod
+    def get_role_catalog(db: Session) -> List[CatalogRole]:
+        """
+        All job roles with their skill requirements, served from the
+        per-process snapshot when it is fresh.
+        """
+        with _role_catalog_lock:
+            catalog = _role_catalog_cache.get(_ROLE_CATALOG_KEY)
+        if catalog is not None:
+            return catalog
+
+        # Roles come with their domain, requirements and required skills
+        # preloaded, so building the snapshot issues no per-role queries
+        roles = db.query(JobRole).options(
+            joinedload(JobRole.domain),
+            selectinload(JobRole.role_skill_requirements).joinedload(RoleSkillRequirement.skill),
+            *_STRICT_LOAD_OPTIONS,
+        ).order_by(JobRole.id).all()
+
+        catalog = [
+            CatalogRole(
+                id=role.id,
+                title=role.title,
+                description=role.description,
+                level=role.level,
+                domain_id=role.domain_id,
+                domain_name=role.domain.name if role.domain else None,
+                demand_score=role.demand_score,
+                growth_rate=role.growth_rate,
+                role_skill_requirements=tuple(
+                    CatalogRequirement(
+                        skill_id=req.skill_id,
+                        required_level=req.required_level,
+                        required_score=level_to_score(req.required_level),
+                        weight=req.weight,
+                        skill=CatalogSkill(
+                            id=req.skill.id,
+                            name=req.skill.name,
+                            description=req.skill.description,
+                        ) if req.skill else None,
+                    )
+                    for req in role.role_skill_requirements
+                ),
+            )
+            for role in roles
+        ]
+
+        with _role_catalog_lock:
+            _role_catalog_cache[_ROLE_CATALOG_KEY] = catalog
+        return catalog
+
+    @staticmethod
+    def invalidate_role_catalog() -> None:
+        """Drop the role snapshot after a role, requirement or skill changes."""
+        with _role_catalog_lock:
+            _role_catalog_cache.pop(_ROLE_CATALOG_KEY, None)
+
     @staticmethod
     def _get_user_latest_domain(db: Session, user_id: int) -> Optional[int]:
         """
         Get the user's latest assessed domain ID.
         """
-        latest_assessment = db.query(SkillAssessment).filter(
+        # Just the column, straight off the (user_id, created_at) index
+        return db.query(SkillAssessment.domain_id).filter(
             SkillAssessment.user_id == user_id
-        ).order_by(desc(SkillAssessment.created_at)).first()
-        
-        return latest_assessment.domain_id if latest_assessment else None
+        ).order_by(desc(SkillAssessment.created_at)).limit(1).scalar()
 
 
     @staticmethod
@@ -103,39 +207,50 @@ class CareerService:
         user_skill_map = CareerService._get_user_skills_map(db, user_id)
         print(f"[DEBUG] Found {len(user_skill_map)} skills for career matching")
 
-        # Get domain name if domain_id is provided
-        domain_name = None
-        if domain_id:
-            domain = db.query(Domain).filter(Domain.id == domain_id).first()
-            domain_name = domain.name if domain else None
-            print(f"[DEBUG] User's domain: {domain_name} (ID: {domain_id})")
+        catalog = CareerService.get_role_catalog(db)
 
-        # Query all roles, optionally filtering by domain
+        # All roles, optionally putting the user's domain first
         if domain_id:
             # Get roles from user's domain first, then other domains
-            domain_roles = db.query(JobRole).filter(JobRole.domain_id == domain_id).all()
-            other_roles = db.query(JobRole).filter(
-                (JobRole.domain_id != domain_id) | (JobRole.domain_id.is_(None))
-            ).all()
+            domain_roles = [role for role in catalog if role.domain_id == domain_id]
+            other_roles = [role for role in catalog if role.domain_id != domain_id]
             roles = domain_roles + other_roles
+            # Domain name comes off the catalog rows; no separate lookup
+            domain_name = domain_roles[0].domain_name if domain_roles else None
+            print(f"[DEBUG] User's domain: {domain_name} (ID: {domain_id})")
             print(f"[DEBUG] Found {len(domain_roles)} roles in user's domain, {len(other_roles)} in other domains")
         else:
-            roles = db.query(JobRole).all()
+            roles = catalog
             
         recommendations = []
 
-
+        # Roles sharing no skill with the user score only what the non-skill
+        # factors give; score them after the rest, and only while they could
+        # still make the top_n
+        overlapping_roles = []
+        disjoint_roles = []
         for role in roles:
-            requirements = db.query(RoleSkillRequirement).filter(
-                RoleSkillRequirement.role_id == role.id
-            ).all()
+            if not role.role_skill_requirements:
+                continue
+            if any(req.skill_id in user_skill_map for req in role.role_skill_requirements):
+                overlapping_roles.append(role)
+            elif min_match <= 0:
+                # Their match percentage is always 0
+                disjoint_roles.append(role)
 
-            if not requirements:
+        disjoint_role_ids = {role.id for role in disjoint_roles}
+
+        for role in overlapping_roles + disjoint_roles:
+            requirements = role.role_skill_requirements
+
+            if role.id in disjoint_role_ids and not CareerService._could_rank(
+                role, domain_id, recommendations, top_n
+            ):
                 continue
 
             # Use AI-enhanced multi-factor scoring
             scoring_result = CareerScoring.calculate_multi_factor_score(
-                db, user_id, requirements
+                db, user_id, requirements, user_skill_map=user_skill_map
             )
 
             # Get matched/missing skills
@@ -152,7 +267,7 @@ class CareerService:
             for req in requirements:
                 user_skill = user_skill_map.get(req.skill_id)
                 current_score = user_skill.score if user_skill else 0
-                required_score = CareerService._level_to_score(req.required_level)
+                required_score = req.required_score  # resolved when the catalog was built
                 
                 skill_requirements.append({
                     "skill_id": req.skill_id,
@@ -185,7 +300,7 @@ class CareerService:
                 "description": role.description,
                 "level": role.level,
                 "domain_id": role.domain_id,
-                "domain_name": role.domain.name if role.domain else None,
+                "domain_name": role.domain_name,
                 "is_in_user_domain": is_in_user_domain,
                 "match_percentage": final_score,
                 "base_match_percentage": scoring_result["final_score"],
@@ -225,16 +340,42 @@ class CareerService:
         # 1. Whether it's in user's domain (True comes before False)
         # 2. Match percentage (descending)
         # 3. Demand score (descending)
-        recommendations.sort(
-            key=lambda x: (
-                not x.get("is_in_user_domain", False),  # Domain matches first
-                x["match_percentage"],  # Higher match percentage
-                x["demand_score"]  # Higher demand score
-            ),
-            reverse=True
+        # Same result as a full reverse sort truncated to top_n
+        return heapq.nlargest(top_n, recommendations, key=CareerService._rank_key)
+
+    @staticmethod
+    def _rank_key(recommendation: Dict[str, Any]) -> tuple:
+        return (
+            not recommendation.get("is_in_user_domain", False),  # Domain matches first
+            recommendation["match_percentage"],  # Higher match percentage
+            recommendation["demand_score"]  # Higher demand score
         )
 
-        return recommendations[:top_n]
+    @staticmethod
+    def _could_rank(
+        role: CatalogRole,
+        domain_id: Optional[int],
+        recommendations: List[Dict[str, Any]],
+        top_n: int
+    ) -> bool:
+        """
+        Whether a role the user has no required skills for could still place
+        in the top_n, given the recommendations scored so far.
+        """
+        is_in_user_domain = bool(domain_id and role.domain_id == domain_id)
+        best_score = min(
+            100,
+            CareerScoring.MAX_SCORE_WITHOUT_SKILL_OVERLAP + (10 if is_in_user_domain else 0)
+        )
+        best_key = (not is_in_user_domain, best_score, role.demand_score)
+
+        ahead = 0
+        for recommendation in recommendations:
+            if CareerService._rank_key(recommendation) > best_key:
+                ahead += 1
+                if ahead >= top_n:
+                    return False
+        return True
 
 
     @staticmethod
@@ -283,7 +424,10 @@ class CareerService:
         """
         Get trending careers based on growth rate and demand.
         """
-        roles = db.query(JobRole).filter(
+        roles = db.query(JobRole).options(
+            selectinload(JobRole.role_skill_requirements).joinedload(RoleSkillRequirement.skill),
+            *_STRICT_LOAD_OPTIONS,
+        ).filter(
             JobRole.growth_rate > 5 if hasattr(JobRole, 'growth_rate') else True
         ).order_by(
             desc(JobRole.demand_score) if hasattr(JobRole, 'demand_score') else desc(JobRole.id)
@@ -291,9 +435,7 @@ class CareerService:
         
         trending = []
         for role in roles:
-            requirements = db.query(RoleSkillRequirement).filter(
-                RoleSkillRequirement.role_id == role.id
-            ).all()
+            requirements = role.role_skill_requirements
             
             trending.append({
                 "role_id": role.id,
@@ -388,16 +530,18 @@ class CareerService:
         missing_skills = []
 
         for req in requirements:
-            total_weight += req.weight
+            weight = req.weight
+            total_weight += weight
 
             user_skill = user_skills.get(req.skill_id)
             current_score = user_skill.score if user_skill else 0
-            required_score = CareerService._level_to_score(req.required_level)
+            required_score = level_to_score(req.required_level)
 
-            skill_name = req.skill.name if req.skill else f"Skill {req.skill_id}"
+            skill = req.skill
+            skill_name = skill.name if skill else f"Skill {req.skill_id}"
 
             if current_score >= required_score:
-                matched_weight += req.weight
+                matched_weight += weight
                 matched_skills.append(skill_name)
             else:
                 missing_skills.append(skill_name)
@@ -426,8 +570,11 @@ class CareerService:
         if not role:
             raise ValueError(f"Job role {job_role_id} not found")
         
-        # Get requirements for this role
-        requirements = db.query(RoleSkillRequirement).filter(
+        # Get requirements for this role, with their skills
+        requirements = db.query(RoleSkillRequirement).options(
+            joinedload(RoleSkillRequirement.skill),
+            *_STRICT_LOAD_OPTIONS,
+        ).filter(
             RoleSkillRequirement.role_id == job_role_id
         ).all()
         
@@ -441,7 +588,7 @@ class CareerService:
         
         # Get AI scoring details
         scoring_result = CareerScoring.calculate_multi_factor_score(
-            db, user_id, requirements
+            db, user_id, requirements, user_skill_map=user_skill_map
         )
         
         # Build detailed requirements with user progress
@@ -449,7 +596,7 @@ class CareerService:
         for req in requirements:
             user_skill = user_skill_map.get(req.skill_id)
             current_score = user_skill.score if user_skill else 0
-            required_score = CareerService._level_to_score(req.required_level)
+            required_score = level_to_score(req.required_level)
             
             # Find severity info if available
             severity_info = next(
@@ -509,13 +656,3 @@ class CareerService:
             ),
             "quality_metrics": scoring_result.get("quality_metrics", {})
         }
-
-
-    @staticmethod
-    def _level_to_score(level: str) -> int:
-        return {
-            "beginner": 25,
-            "intermediate": 50,
-            "advanced": 75,
-            "expert": 100,
-        }.get(level, 25)
@@ -1,10 +1,12 @@
 from typing import Dict, Any, List
 from collections import defaultdict, deque
 from datetime import datetime
+import json
 import numpy as np
 import random
+import traceback
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from models.learning_path import LearningPath, LearningPathStepAssociation
 from models.learning_path_step import LearningPathStep
@@ -13,9 +15,28 @@ from models.user_skill import UserSkill
 from models.job_role import JobRole
 from models.role_skill_requirement import RoleSkillRequirement
 from models.skill import Skill
+from models.database import cache_key, get_redis
 from ai.learning_optimizer import LearningOptimizer
 
 
+# Per-user cache of the /learning/paths payload
+PATHS_CACHE_TTL_SECONDS = 60
+
+
+def _paths_cache_key(user_id: int) -> str:
+    return cache_key(f"learning_paths:{user_id}")
+
+
+def _path_load_options():
+    """Eager-load everything LearningPath.to_dict() touches."""
+    return (
+        selectinload(LearningPath.target_role),
+        selectinload(LearningPath.steps)
+        .selectinload(LearningPathStepAssociation.step)
+        .selectinload(LearningPathStep.skill),
+    )
+
+
 
 class LearningService:
     """
@@ -74,6 +95,7 @@ class LearningService:
                 db.add(path)
                 db.commit()
                 db.refresh(path)
+                LearningService.invalidate_paths_cache(user_id)
                 return path.to_dict()
 
             user_skills = db.query(UserSkill).filter_by(user_id=user_id).all()
@@ -102,6 +124,7 @@ class LearningService:
                 db.add(path)
                 db.commit()
                 db.refresh(path)
+                LearningService.invalidate_paths_cache(user_id)
                 return path.to_dict()
 
             # ------------------------------------------
@@ -207,13 +230,13 @@ class LearningService:
 
             db.commit()
             db.refresh(path)
+            LearningService.invalidate_paths_cache(user_id)
 
             return path.to_dict()
 
         except Exception as e:
             db.rollback()
             print(f"Error in generate_learning_path: {str(e)}")
-            import traceback
             traceback.print_exc()
             raise
 
@@ -348,6 +371,7 @@ class LearningService:
             except AttributeError:
                 pass  # Column doesn't exist
             db.commit()
+            LearningService.invalidate_paths_cache(user_id)
             return {
                 "passed": True,
                 "score": 100,
@@ -382,6 +406,7 @@ class LearningService:
         except AttributeError:
             pass  # Column doesn't exist, continue without saving
         db.commit()
+        LearningService.invalidate_paths_cache(user_id)
 
         return {
             "passed": passed,
@@ -646,6 +671,7 @@ class LearningService:
 
         db.commit()
         db.refresh(path)
+        LearningService.invalidate_paths_cache(user_id)
 
         return path.to_dict()
 
@@ -700,13 +726,58 @@ class LearningService:
         """
         Get all learning paths for a user
         """
-        paths = db.query(LearningPath).filter_by(user_id=user_id).all()
+        cached = LearningService._get_cached_paths(user_id)
+        if cached is not None:
+            return cached
+
+        paths = (
+            db.query(LearningPath)
+            .options(*_path_load_options())
+            .filter_by(user_id=user_id)
+            .all()
+        )
         if not paths:
             raise ValueError("No learning paths found")
-        return {
+        result = {
             "paths": [p.to_dict() for p in paths],
             "count": len(paths)
         }
+        LearningService._set_cached_paths(user_id, result)
+        return result
+
+    # --------------------------------------------------
+    # PATHS CACHE
+    # --------------------------------------------------
+    @staticmethod
+    def _get_cached_paths(user_id: int):
+        client = get_redis()
+        if client is None:
+            return None
+        try:
+            raw = client.get(_paths_cache_key(user_id))
+        except Exception:
+            return None
+        return json.loads(raw) if raw else None
+
+    @staticmethod
+    def _set_cached_paths(user_id: int, payload: Dict[str, Any]) -> None:
+        client = get_redis()
+        if client is None:
+            return
+        try:
+            client.setex(_paths_cache_key(user_id), PATHS_CACHE_TTL_SECONDS, json.dumps(payload))
+        except Exception:
+            pass
+
+    @staticmethod
+    def invalidate_paths_cache(user_id: int) -> None:
+        client = get_redis()
+        if client is None:
+            return
+        try:
+            client.delete(_paths_cache_key(user_id))
+        except Exception:
+            pass
 
     # --------------------------------------------------
     # GET PATH DETAILS
@@ -720,7 +791,7 @@ class LearningService:
         """
         Get detailed information about a specific learning path
         """
-        path = db.query(LearningPath).filter_by(
+        path = db.query(LearningPath).options(*_path_load_options()).filter_by(
             id=path_id,
             user_id=user_id
         ).first()
@@ -776,6 +847,7 @@ class LearningService:
 
         db.commit()
         db.refresh(path)
+        LearningService.invalidate_paths_cache(user_id)
 
         return path.to_dict()
 
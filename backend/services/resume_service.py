@@ -6,7 +6,8 @@ import re
 import json
 from typing import Dict, List, Any, Optional
 from datetime import datetime
-from sqlalchemy.orm import Session
+from sqlalchemy import JSON, func, select, update
+from sqlalchemy.orm import Session, defer
 
 from models.resume import Resume
 from models.user import User
@@ -48,10 +49,16 @@ class ResumeService:
         education: Optional[List[Dict]] = None,
         skills: Optional[List[str]] = None,
         certifications: Optional[List[Dict]] = None,
-        projects: Optional[List[Dict]] = None
+        projects: Optional[List[Dict]] = None,
+        parsed_content: Optional[str] = None,
+        original_filename: Optional[str] = None,
+        ats_analysis: Optional[Dict[str, Any]] = None
     ) -> Resume:
         """
-        Create a new resume for a user
+        Create a new resume for a user.
+        Skills, experience, education etc. are JSON columns on the resume row,
+        so everything (including upload metadata and the initial ATS analysis)
+        is written in a single INSERT.
         """
         resume = Resume(
             user_id=user_id,
@@ -62,7 +69,11 @@ class ResumeService:
             education=education or [],
             skills=skills or [],
             certifications=certifications or [],
-            projects=projects or []
+            projects=projects or [],
+            parsed_content=parsed_content,
+            original_filename=original_filename,
+            ats_score=ats_analysis["overall_score"] if ats_analysis else None,
+            ats_analysis=ats_analysis
         )
         
         db.add(resume)
@@ -111,7 +122,74 @@ class ResumeService:
         """
         Get all resumes for a user
         """
-        return Resume.find_by_user(db, user_id)
+        # parsed_content is never part of the listing payload, so keep the
+        # raw extracted text out of the SELECT
+        return (
+            db.query(Resume)
+            .options(defer(Resume.parsed_content))
+            .filter(Resume.user_id == user_id)
+            .order_by(Resume.created_at.desc())
+            .all()
+        )
+    
+    @staticmethod
+    def get_ats_source_text(db: Session, resume_id: int, user_id: int) -> Optional[str]:
+        """
+        Build the text used for ATS analysis without hydrating the Resume entity.
+        Returns None when the resume does not exist for this user.
+        """
+        experience = Resume.experience
+        if db.get_bind().dialect.name == "mysql":
+            # Only descriptions are needed; let MySQL project them out of the
+            # experience array instead of shipping and decoding every entry
+            experience = func.json_extract(
+                Resume.experience, "$[*].description", type_=JSON
+            )
+        
+        row = db.execute(
+            select(
+                Resume.parsed_content,
+                Resume.summary,
+                Resume.skills,
+                experience.label("experience"),
+            ).where(Resume.id == resume_id, Resume.user_id == user_id)
+        ).first()
+        
+        if row is None:
+            return None
+        
+        if row.parsed_content:
+            return row.parsed_content
+        
+        # If no parsed content, build from structured data
+        text_parts = []
+        if row.summary:
+            text_parts.append(row.summary)
+        if row.skills:
+            text_parts.append(" ".join(row.skills))
+        if row.experience:
+            for exp in row.experience:
+                if isinstance(exp, dict):
+                    exp = exp.get("description", "")
+                text_parts.append(exp or "")
+        return " ".join(text_parts)
+    
+    @staticmethod
+    def save_ats_analysis(
+        db: Session,
+        resume_id: int,
+        user_id: int,
+        ats_analysis: Dict[str, Any]
+    ) -> None:
+        """
+        Persist an ATS analysis with a single UPDATE
+        """
+        db.execute(
+            update(Resume)
+            .where(Resume.id == resume_id, Resume.user_id == user_id)
+            .values(ats_score=ats_analysis["overall_score"], ats_analysis=ats_analysis)
+        )
+        db.commit()
     
     @staticmethod
     def parse_resume_file(file_content: bytes, filename: str) -> Dict[str, Any]:
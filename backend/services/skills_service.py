@@ -1,21 +1,45 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime
+import json
 
 import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from models.user_skill import UserSkill
 from models.skill import Skill
+from models.domain import Domain
 from models.skill_assessment import SkillAssessment, SkillAssessmentSkill
 from models.job_role import JobRole
 from models.role_skill_requirement import RoleSkillRequirement
+from models.database import cache_key, get_redis
 from ai.skill_similarity import SkillSimilarity
 from ai.skill_inference import SkillInference
 
 
+# Skill catalog responses live in one Redis hash ("all" and "domain:<id>"
+# fields) so any skill/domain mutation can drop them with a single DEL. The
+# key is scoped to this environment's database like every other cache key
+SKILL_CATALOG_CACHE_KEY = cache_key("skills_catalog")
+SKILL_CATALOG_CACHE_TTL_SECONDS = 300
+
+# (level, gap) for quiz percentages: <=40, <=70, >70
+_LEVEL_GAP_BUCKETS = (
+    ("Beginner", "High"),
+    ("Intermediate", "Medium"),
+    ("Advanced", "Low"),
+)
+
+
+def classify_percentage(percentage: float):
+    """
+    Map a quiz percentage to its (level, gap) pair.
+    """
+    return _LEVEL_GAP_BUCKETS[(percentage > 40) + (percentage > 70)]
+
 
 class SkillsService:
     """
@@ -122,6 +146,78 @@ class SkillsService:
             "skills_processed": len(skills_data),
         }
 
+    # -----------------------------------------------------
+    # SKILL CATALOG (CACHED)
+    # -----------------------------------------------------
+    @staticmethod
+    def get_skill_catalog(
+        db: Session,
+        domain_id: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        All skills, or the skills of one domain, served from Redis when cached.
+        """
+        field = "all" if domain_id is None else f"domain:{domain_id}"
+        client = get_redis()
+
+        if client is not None:
+            try:
+                raw = client.hget(SKILL_CATALOG_CACHE_KEY, field)
+                if raw:
+                    return json.loads(raw)
+            except Exception:
+                pass
+
+        # Column projection with the domain name joined in: same shape as
+        # Skill.to_dict() without hydrating entities or lazy-loading domains
+        query = db.query(
+            Skill.id,
+            Skill.name,
+            Skill.description,
+            Skill.domain_id,
+            Domain.name.label("category"),
+            Skill.demand_level,
+            Skill.depends_on,
+        ).outerjoin(Domain, Skill.domain_id == Domain.id)
+        if domain_id is not None:
+            query = query.filter(Skill.domain_id == domain_id)
+        skills = [
+            {
+                "id": row.id,
+                "name": row.name,
+                "description": row.description,
+                "domainId": row.domain_id,
+                "category": row.category,
+                "demandLevel": row.demand_level,
+                "depends_on": Skill.parse_depends_on(row.depends_on),
+            }
+            for row in query.all()
+        ]
+
+        if client is not None:
+            try:
+                pipe = client.pipeline()
+                pipe.hset(SKILL_CATALOG_CACHE_KEY, field, json.dumps(skills))
+                pipe.expire(SKILL_CATALOG_CACHE_KEY, SKILL_CATALOG_CACHE_TTL_SECONDS)
+                pipe.execute()
+            except Exception:
+                pass
+
+        return skills
+
+    @staticmethod
+    def invalidate_skill_catalog() -> None:
+        """
+        Drop cached catalog responses after a skill or domain changes.
+        """
+        client = get_redis()
+        if client is None:
+            return
+        try:
+            client.delete(SKILL_CATALOG_CACHE_KEY)
+        except Exception:
+            pass
+
     # -----------------------------------------------------
     # UPDATE SINGLE SKILL
     # -----------------------------------------------------
@@ -225,9 +321,6 @@ class SkillsService:
     ) -> Dict[str, Any]:
         # Get latest skill assessment scores from SkillAssessmentSkill table
         # This table has correct scores (percentages), unlike UserSkill which has corrupted data
-        from sqlalchemy import func, and_
-        from models.skill_assessment import SkillAssessmentSkill, SkillAssessment
-        
         print(f"[DEBUG] analyze_skills called for user {user_id}")
         
         # Get the latest assessment for each skill using a proper subquery
@@ -713,22 +806,23 @@ class SkillsService:
     def submit_quiz_answers(
         db: Session,
         user_id: int,
-        quiz_answers: Dict[str, Any]
+        submission: Any
     ) -> Dict[str, Any]:
         """
-        Submit quiz answers and calculate scores
+        Submit quiz answers and calculate scores.
+        `submission` is the validated QuizSubmission model; its answers are
+        read by attribute rather than dumped back to dicts.
         """
-        skill_answers = quiz_answers.get("answers", {})
         skill_scores = {}
 
-        for skill_id_str, answers in skill_answers.items():
+        for skill_id_str, answers in submission.answers.items():
             skill_id = int(skill_id_str)
             correct_count = 0
             total_questions = len(answers)
 
             for answer_data in answers:
-                question_id = answer_data["question_id"]
-                user_answer = answer_data["answer"]
+                question_id = answer_data.question_id
+                user_answer = answer_data.answer
 
                 # Get question and check answer
                 question = db.query(SkillQuestion).filter(SkillQuestion.id == question_id).first()
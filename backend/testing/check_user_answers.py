@@ -29,7 +29,7 @@ def check_user_answers():
         
         print(f"Total answers: {len(answers)}")
         
-        correct_count = sum(1 for a in answers if a.is_correct == 'true')
+        correct_count = sum(1 for a in answers if a.is_correct)
         print(f"Correct answers: {correct_count}")
         
         for answer in answers[:5]:  # Show first 5